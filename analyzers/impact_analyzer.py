@@ -8,7 +8,9 @@ to produce comprehensive impact analysis reports.
 from typing import List, Dict, Optional, Tuple
 import logging
 from datetime import datetime
+from pathlib import Path
 import json
+import re
 
 from models.sttm_models import STTMDocument, STTMTab
 from models.test_models import QTestDocument, TestCase
@@ -33,6 +35,13 @@ class ImpactAnalyzer:
         self.impact_scorer = DataDrivenImpactScorer(config, logger)
         self.sttm_parser = STTMParser(logger)
         self.qtest_parser = QTestParser(logger)
+        
+        # Latest parsed QTEST document per file path, stamped with the file's
+        # (mtime_ns, size) and the parser's adapter types. Scoped to this analyzer,
+        # so it lives exactly as long as the instance (e.g. one API request, or a
+        # QuickImpactAnalyzer session). The documents are only read here and never
+        # handed out, so callers that edit test cases always use a fresh parse.
+        self._qtest_documents: Dict[str, Tuple[tuple, QTestDocument]] = {}
     
     def analyze_impact(self, sttm_file_path: str, qtest_file_path: str) -> ImpactAnalysisReport:
         """Perform complete impact analysis between STTM changes and test cases"""
@@ -45,7 +54,28 @@ class ImpactAnalyzer:
         sttm_document = self.sttm_parser.parse_file(sttm_file_path)
         
         self.logger.info("Parsing QTEST document...")
-        qtest_document = self.qtest_parser.parse_file(qtest_file_path)
+        qtest_document = self._parse_qtest_document(qtest_file_path)
+        
+        return self._analyze_documents(sttm_document, qtest_document,
+                                       sttm_file_path, qtest_file_path, start_time)
+    
+    def analyze_documents(self, sttm_document: STTMDocument, qtest_document: QTestDocument,
+                          sttm_file_path: str = "", qtest_file_path: str = "") -> ImpactAnalysisReport:
+        """Perform impact analysis on already parsed STTM and QTEST documents
+        
+        Use this when the caller needs the parsed documents anyway (e.g. test step
+        generation), so the files are not parsed a second time. The file paths are
+        only recorded in the report.
+        """
+        
+        self.logger.info(f"Starting impact analysis: STTM={sttm_file_path}, QTEST={qtest_file_path}")
+        return self._analyze_documents(sttm_document, qtest_document,
+                                       sttm_file_path, qtest_file_path, datetime.now())
+    
+    def _analyze_documents(self, sttm_document: STTMDocument, qtest_document: QTestDocument,
+                           sttm_file_path: str, qtest_file_path: str,
+                           start_time: datetime) -> ImpactAnalysisReport:
+        """Score every changed STTM tab against all test cases and build the report"""
         
         self.logger.info(f"Loaded {sttm_document.total_tabs} STTM tabs and {qtest_document.total_test_cases} test cases")
         
@@ -77,6 +107,27 @@ class ImpactAnalyzer:
         
         return report
     
+    def _parse_qtest_document(self, qtest_file_path: str) -> QTestDocument:
+        """Parse the QTEST file, reusing this analyzer's earlier parse if the file is unchanged"""
+        
+        try:
+            path = Path(qtest_file_path)
+            stat = path.stat()
+        except OSError:
+            # Let the parser report missing/unreadable files as usual
+            return self.qtest_parser.parse_file(qtest_file_path)
+        
+        cache_path = str(path.resolve())
+        stamp = (stat.st_mtime_ns, stat.st_size, self.qtest_parser.adapter_factory.adapter_types())
+        cached = self._qtest_documents.get(cache_path)
+        if cached is not None and cached[0] == stamp:
+            self.logger.info(f"Using cached QTEST document for unchanged file: {qtest_file_path}")
+            return cached[1]
+        
+        document = self.qtest_parser.parse_file(qtest_file_path)
+        self._qtest_documents[cache_path] = (stamp, document)
+        return document
+    
     def analyze_single_test_case(self, test_case: TestCase, sttm_tab: STTMTab) -> TestCaseImpactAssessment:
         """Analyze impact of a single STTM tab on a single test case"""
         
@@ -131,7 +182,6 @@ class ImpactAnalyzer:
     
     def _find_affected_steps(self, test_case: TestCase, sttm_tab: STTMTab) -> List[int]:
         """Find which test steps are affected by STTM changes based on exact field names or tab names"""
-        import re
         affected_steps = []
         
         # Collect exact field names that changed (no partial matching)
@@ -236,12 +286,31 @@ class QuickImpactAnalyzer:
     def __init__(self, config: Optional[ImpactAnalysisConfig] = None):
         self.config = config or ImpactAnalysisConfig()
         self.analyzer = ImpactAnalyzer(self.config)
+        # Latest report per (sttm_file, qtest_file), stamped with the files' mtimes
+        self._report_cache: Dict[Tuple[str, str], Tuple[tuple, ImpactAnalysisReport]] = {}
+    
+    def _get_report(self, sttm_file: str, qtest_file: str) -> ImpactAnalysisReport:
+        """Run the analysis, reusing the previous report while both files are unchanged"""
+        
+        try:
+            files_stamp = (Path(sttm_file).stat().st_mtime_ns, Path(qtest_file).stat().st_mtime_ns)
+        except OSError:
+            # Let the parsers report missing/unreadable files as usual
+            return self.analyzer.analyze_impact(sttm_file, qtest_file)
+        
+        cached = self._report_cache.get((sttm_file, qtest_file))
+        if cached is not None and cached[0] == files_stamp:
+            return cached[1]
+        
+        report = self.analyzer.analyze_impact(sttm_file, qtest_file)
+        self._report_cache[(sttm_file, qtest_file)] = (files_stamp, report)
+        return report
     
     def quick_check(self, sttm_file: str, qtest_file: str) -> str:
         """Perform quick impact analysis and return summary"""
         
         try:
-            report = self.analyzer.analyze_impact(sttm_file, qtest_file)
+            report = self._get_report(sttm_file, qtest_file)
             return report.get_executive_summary()
         
         except Exception as e:
@@ -251,7 +320,7 @@ class QuickImpactAnalyzer:
         """Get list of priority actions needed"""
         
         try:
-            report = self.analyzer.analyze_impact(sttm_file, qtest_file)
+            report = self._get_report(sttm_file, qtest_file)
             actions = []
             
             for tab_summary in report.tab_summaries:
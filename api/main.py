@@ -1063,15 +1063,9 @@ async def analyze_impact_from_comparison(
         # Import Path for file operations
         from pathlib import Path
         import json
-        import tempfile
-        
-        # Create temporary STTM JSON file from fetched content
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_sttm:
-            json.dump(json_content, temp_sttm)
-            temp_sttm_path = temp_sttm.name
         
         try:
-            # Copy the JSON to input_files/sttm temporarily
+            # Write the fetched JSON to input_files/sttm temporarily
             sttm_dir = Path(__file__).parent.parent / "input_files" / "sttm"
             sttm_dir.mkdir(parents=True, exist_ok=True)
             
@@ -1169,8 +1163,6 @@ async def analyze_impact_from_comparison(
             
         finally:
             # Cleanup temporary files
-            if os.path.exists(temp_sttm_path):
-                os.unlink(temp_sttm_path)
             if sttm_file_path.exists():
                 sttm_file_path.unlink()
             # Cleanup QTest temp file from Azure
@@ -1299,16 +1291,10 @@ async def generate_test_steps_from_comparison(
                 detail="Invalid JSON structure in comparison"
             )
         
-        # Create temporary STTM JSON file from fetched content
         import json
-        import tempfile
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_sttm:
-            json.dump(json_content, temp_sttm)
-            temp_sttm_path = temp_sttm.name
         
         try:
-            # Copy the JSON to input_files/sttm temporarily
+            # Write the fetched JSON to input_files/sttm temporarily
             sttm_dir = Path(__file__).parent.parent / "input_files" / "sttm"
             sttm_dir.mkdir(parents=True, exist_ok=True)
             
@@ -1353,13 +1339,14 @@ async def generate_test_steps_from_comparison(
             sttm_path = str(sttm_file_path)
             qtest_path_str = qtest_temp_path  # Use the temp path directly from Azure
             
-            # Parse documents and run analysis to get objects (same as working endpoint)
+            # Parse the QTEST document once for both the analysis and the test cases
             analyzer = ImpactAnalyzer(analysis_config, logger)
-            impact_report = analyzer.analyze_impact(sttm_path, qtest_path_str)
-            
-            # Parse qtest document separately to get test cases  
             qtest_parser = QTestParser(logger)
             qtest_document = qtest_parser.parse_file(qtest_path_str)
+            impact_report = analyzer.analyze_documents(
+                analyzer.sttm_parser.parse_file(sttm_path), qtest_document,
+                sttm_path, qtest_path_str
+            )
             test_cases = qtest_document.test_cases
             
             # Generate test steps using the exact same call as working endpoint
@@ -1472,8 +1459,6 @@ async def generate_test_steps_from_comparison(
             
         finally:
             # Cleanup temporary files
-            if os.path.exists(temp_sttm_path):
-                os.unlink(temp_sttm_path)
             if sttm_file_path.exists():
                 sttm_file_path.unlink()
             # Cleanup QTest temp file from Azure
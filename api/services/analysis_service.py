@@ -63,17 +63,7 @@ class AnalysisService:
                 analysis_config = ImpactAnalysisConfig()
                 self.logger.info("Using default analysis configuration")
             
-            # Parse documents first to get the original objects
-            from parsers.sttm_parser import STTMParser
-            from parsers.qtest_parser import QTestParser
-            
-            sttm_parser = STTMParser(self.logger)
-            qtest_parser = QTestParser(self.logger)
-            
-            sttm_document = sttm_parser.parse_file(sttm_path)
-            qtest_document = qtest_parser.parse_file(qtest_path)
-            
-            # Run impact analysis using existing CLI logic
+            # Run impact analysis (the analyzer parses both input files) using existing CLI logic
             analyzer = ImpactAnalyzer(analysis_config, self.logger)
             report = analyzer.analyze_impact(sttm_path, qtest_path)
             
@@ -8,6 +8,14 @@ from typing import List, Optional
 import json
 import logging
 
+try:
+    # orjson parses straight from bytes and is several times faster than the
+    # stdlib parser on large STTM diff reports. Its JSONDecodeError subclasses
+    # json.JSONDecodeError, so error handling below is unchanged.
+    import orjson as _json
+except ImportError:
+    _json = json
+
 
 class FileService:
     """Service for managing STTM and QTEST input files"""
@@ -45,8 +53,7 @@ class FileService:
                 
                 # Try to validate JSON structure
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        json.load(f)
+                    _json.loads(file_path.read_bytes())
                 except json.JSONDecodeError as e:
                     file_info["valid"] = False
                     file_info["error"] = f"Invalid JSON: {str(e)}"
@@ -133,8 +140,7 @@ class FileService:
             file_path = self.get_sttm_path(filename)
             
             # Try to parse JSON
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _json.loads(Path(file_path).read_bytes())
             
             # Basic structure validation
             validation_result = {
@@ -6,6 +6,7 @@ Wraps the existing TestStepGenerator to provide API-friendly interfaces.
 """
 
 import logging
+import sys
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import os
@@ -112,23 +113,20 @@ class TestStepService:
                 self.logger.warning("No generated steps found in data")
                 return ""
             
-            # Convert serialized steps back to GeneratedTestStep objects
-            from templates.step_templates import GeneratedTestStep
-            
+            # Convert serialized steps back to GeneratedTestStep objects. Actions
+            # are interned so every step shares the ADD/MODIFY/DELETE strings the
+            # exporter compares against, instead of one copy per parsed step
             steps_objects = []
             for step_data in generated_steps_list:
                 step = GeneratedTestStep(
                     step_number=step_data.get('step_number', 1),
                     description=step_data.get('action_description', ''),
                     expected_result=step_data.get('expected_result', ''),
-                    action=step_data.get('action', 'ADD'),
-                    notes=step_data.get('notes', '')
+                    action=sys.intern(step_data.get('action', 'ADD')),
+                    notes=step_data.get('notes', ''),
+                    field_name=step_data.get('field_name'),
+                    change_type=step_data.get('change_type')
                 )
-                # Add any additional attributes
-                if 'field_name' in step_data:
-                    step.field_name = step_data['field_name']
-                if 'change_type' in step_data:
-                    step.change_type = step_data['change_type']
                 steps_objects.append(step)
             
             self.logger.info(f"Converting {len(steps_objects)} steps to Excel format")
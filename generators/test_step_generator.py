@@ -9,6 +9,7 @@ Implements the confirmed approach:
 """
 
 import logging
+import re
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
@@ -189,8 +190,6 @@ class TestStepGenerator:
     
     def _extract_fields_from_evidence(self, evidence: str, change_type: str) -> List[str]:
         """Extract field names from evidence strings like "Deleted fields: ['PostCode']" """
-        import re
-        
         # Look for patterns like ['field1', 'field2'] or ["field1", "field2"]
         pattern = r'\[([^\]]+)\]'
         match = re.search(pattern, evidence)
@@ -207,8 +206,6 @@ class TestStepGenerator:
     def _extract_field_references(self, evidence: str) -> List[str]:
         """Extract field references from evidence strings"""
         # Look for patterns after 'field name references:' or similar
-        import re
-        
         # Pattern like "Test references changed field names: ZipCode"
         pattern = r'field names?\s*:\s*([^\s,]+)'
         match = re.search(pattern, evidence, re.IGNORECASE)
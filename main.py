@@ -616,11 +616,13 @@ def generate_test_steps_command(sttm_file: str, qtest_file: str, config_file: Op
         # Run impact analysis directly to get the report object
         logger.info("[IMPACT] Running impact analysis for test step generation...")
         analyzer = ImpactAnalyzer(config, logger)
-        impact_report = analyzer.analyze_impact(sttm_file, qtest_file)
         
-        # Parse QTEST file to get test case data for step generation
+        # Parse QTEST file once: it feeds both the analysis and step generation
         logger.info("[QTEST] Parsing QTEST file for test case data...")
         qtest_document = parse_qtest_file(qtest_file, logger)
+        impact_report = analyzer.analyze_documents(
+            analyzer.sttm_parser.parse_file(sttm_file), qtest_document, sttm_file, qtest_file
+        )
         
         if not qtest_document or not qtest_document.test_cases:
             return {
@@ -3,7 +3,7 @@ Test case data models for representing parsed QTEST data.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Pattern, Tuple
 import re
 
 
@@ -123,13 +123,17 @@ class IDPatternAnalysis:
     pattern: str
     format_description: str
     confidence: float
-    sample_ids: List[str] = field(default_factory=list)
+    sample_ids: Tuple[str, ...] = ()
     
     # Pattern components
     prefix: Optional[str] = None
     separator: Optional[str] = None
     number_part: Optional[str] = None
     
+    # `pattern` (the extraction regex) compiled case-insensitively, reused by
+    # validators instead of recompiling
+    compiled_extract_regex: Optional[Pattern] = field(default=None, repr=False, compare=False)
+    
     def generate_new_id(self, suffix: str = "NEW") -> str:
         """Generate a new test case ID based on detected pattern"""
         if self.prefix and self.separator:
@@ -66,7 +66,7 @@ class NewSTTMFormatV3Adapter(STTMFormatAdapter):
             raw_tab = self._extract_v3_tab_data(worksheet)
             raw_tabs.append(raw_tab)
         
-        self.logger.debug(f"Extracted {len(raw_tabs)} tabs from v3.0 format")
+        self.logger.debug("Extracted %d tabs from v3.0 format", len(raw_tabs))
         return raw_tabs
     
     def _extract_v3_tab_data(self, worksheet_data: Dict[str, Any]) -> RawTabData:
@@ -102,9 +102,9 @@ class NewSTTMFormatV3Adapter(STTMFormatAdapter):
                 deleted_mappings.append(raw_mapping)
             elif action == "UPDATE":
                 raw_mapping.change_type = "modified"
-                raw_mapping.original_values = {"value": change.get("before")}
-                raw_mapping.new_values = {"value": change.get("after")}
-                raw_mapping.modified_fields = ["value"]
+                raw_mapping.field_changes = {
+                    "value": {"old_value": change.get("before"), "new_value": change.get("after")}
+                }
                 modified_mappings.append(raw_mapping)
         
         raw_tab.added_mappings = added_mappings
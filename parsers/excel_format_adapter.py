@@ -6,12 +6,12 @@ adapter needs to be updated, not the core test case parser or other components.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 import pandas as pd
 import logging
 
-from models.test_models import TestCase, TestStep
+from models.test_models import TestCase, TestStep, IDPatternAnalysis
 
 
 @dataclass
@@ -76,6 +76,15 @@ class ExcelFormatAdapter(ABC):
     def extract_test_cases(self, df: pd.DataFrame, sheet_names: List[str]) -> ExcelParsingResult:
         """Extract test cases from the Excel dataframe"""
         pass
+    
+    def get_known_id_pattern(self) -> Optional[IDPatternAnalysis]:
+        """Get the test case ID pattern this format is known to use.
+        
+        Adapters for exports with a fixed ID format can return a pre-built
+        analysis so the parser skips ID pattern detection. Returns None when
+        the pattern must be detected from the data.
+        """
+        return None
 
 
 class QTestExcelFormatAdapter(ExcelFormatAdapter):
@@ -318,6 +327,10 @@ class ExcelFormatAdapterFactory:
     def register_adapter(self, adapter: ExcelFormatAdapter):
         """Register a new Excel format adapter"""
         self._adapters.insert(0, adapter)  # Insert at beginning for priority
+    
+    def adapter_types(self) -> Tuple[type, ...]:
+        """Classes of the registered adapters in priority order (e.g. for cache keys)"""
+        return tuple(type(adapter) for adapter in self._adapters)
 
 
 class ExcelDataConverter:
@@ -326,10 +339,15 @@ class ExcelDataConverter:
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(__name__)
     
-    def convert_to_test_cases(self, raw_test_cases: List[RawTestCaseData]) -> List[TestCase]:
-        """Convert raw test case data to TestCase domain models"""
+    def convert_to_test_cases(self, raw_test_cases: List[RawTestCaseData]) -> Tuple[List[TestCase], int]:
+        """Convert raw test case data to TestCase domain models.
+        
+        Returns the test cases together with their total step count, which is
+        accumulated during conversion so callers don't have to walk them again.
+        """
         
         test_cases = []
+        total_steps = 0
         
         for raw_tc in raw_test_cases:
             test_case = TestCase(
@@ -352,8 +370,9 @@ class ExcelDataConverter:
             self._analyze_test_case_content(test_case)
             
             test_cases.append(test_case)
+            total_steps += len(test_case.test_steps)
         
-        return test_cases
+        return test_cases, total_steps
     
     def _analyze_test_case_content(self, test_case: TestCase):
         """Perform basic content analysis to identify references"""
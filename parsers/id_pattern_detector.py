@@ -4,12 +4,51 @@ Test Case ID Pattern Detector - Auto-discovers test case ID formats from QTEST e
 
 import re
 import logging
+from functools import lru_cache
+from itertools import islice
 from typing import List, Dict, Optional, Tuple
 from collections import Counter
 
 from models.test_models import IDPatternAnalysis
 
 
+# Every character re.IGNORECASE matches for [A-Z]: ASCII letters plus the
+# non-ASCII characters that case-fold onto them (İ, ı, ſ and the Kelvin sign)
+_FOLDED_LETTER = r'[A-Za-z\u0130\u0131\u017f\u212a]'
+
+# Letters followed by an optional separator and digits, used to infer custom formats
+_CUSTOM_PREFIX_RE = re.compile(r'^([A-Za-z]+)([^A-Za-z\d]*)(\d*)')
+
+
+@lru_cache(maxsize=64)
+def _build_custom_pattern(prefix: str, separator: Optional[str]) -> Tuple[str, str, str, re.Pattern,
+                                                                          re.Pattern, re.Pattern]:
+    """Build and compile the match/extract regexes for a custom ID format.
+    
+    Returns (pattern, description, extract_regex, compiled_pattern, compiled_extract,
+    compiled_components), where compiled_components uses the prefix/sep/num named
+    groups expected by IDPatternDetector._analyze_pattern_components.
+    Cached because the same prefix/separator pairs recur across files of one family.
+    """
+    escaped_prefix = re.escape(prefix)
+    if separator:
+        escaped_separator = re.escape(separator)
+        pattern = ''.join(('^', escaped_prefix, escaped_separator, r'\d+$'))
+        description = f"{prefix}{separator}#### format"
+        extract_regex = ''.join(('(', escaped_prefix, ')', escaped_separator, r'(\d+)'))
+        component_regex = ''.join(('(?P<prefix>', escaped_prefix, ')', escaped_separator,
+                                   r'(?P<num>\d+)'))
+    else:
+        pattern = ''.join(('^', escaped_prefix, r'\d*.*$'))
+        description = f"{prefix}#### format (custom)"
+        extract_regex = ''.join(('(', escaped_prefix, ')(.*)'))
+        component_regex = ''.join(('(?P<prefix>', escaped_prefix, r')(?:(?P<num>\d+)$|(?P<sep>.*))'))
+    
+    return (pattern, description, extract_regex,
+            re.compile(pattern, re.IGNORECASE), re.compile(extract_regex, re.IGNORECASE),
+            re.compile(component_regex, re.IGNORECASE))
+
+
 class IDPatternDetector:
     """Detects and analyzes test case ID patterns from QTEST exports"""
     
@@ -25,6 +64,69 @@ class IDPatternDetector:
         (r'^.+-\w+$', 'Complex format', r'(.+)-(\w+)'),
     ]
     
+    # Component extractors for ID_PATTERNS with fixed named groups prefix/sep/num.
+    # A trailing all-digit part is the number, any other trailing part is the
+    # separator, and numeric-only IDs keep reporting their digits as the prefix.
+    COMPONENT_PATTERNS = {
+        description: re.compile(component_regex, re.IGNORECASE)
+        for description, component_regex in (
+            ('TC-#### format', r'(?P<prefix>TC)-?(?P<num>\d+)'),
+            ('TEST-#### format', r'(?P<prefix>TEST)-?(?P<num>\d+)'),
+            ('T-#### format', r'(?P<prefix>T)-?(?P<num>\d+)'),
+            ('PREFIX-#### format', r'(?P<prefix>[A-Z]+)-(?P<num>\d+)'),
+            ('Numeric only format', r'(?P<prefix>\d+)'),
+            ('ALPHA#### format', r'(?P<prefix>[A-Z]{2,4})(?P<num>\d+)'),
+            ('Complex format', r'(?P<prefix>.+)-(?:(?P<num>\d+)(?!\w)|(?P<sep>\w+))'),
+        )
+    }
+    
+    # Case-insensitive compiled extraction regexes for ID_PATTERNS, keyed by description
+    COMPILED_EXTRACT_PATTERNS = {
+        description: re.compile(extract_regex, re.IGNORECASE)
+        for _, description, extract_regex in ID_PATTERNS
+    }
+    
+    # Case-sensitive equivalents of the ID_PATTERNS match regexes, used for
+    # scanning. Letters are spelled out as explicit classes covering everything
+    # re.IGNORECASE would fold onto them, so the regex engine skips per-character
+    # case folding while matching exactly the same IDs.
+    CASE_SENSITIVE_ID_PATTERNS = [
+        r'^[Tt][Cc]-?\d+$',
+        r'^[Tt][Ee][Ss\u017f][Tt]-?\d+$',
+        r'^[Tt]-?\d+$',
+        rf'^{_FOLDED_LETTER}+-\d+$',
+        r'^\d+$',
+        rf'^{_FOLDED_LETTER}{{2,4}}\d+$',
+        r'^.+-\w+$',
+    ]
+    
+    # Compiled (match_regex, pattern, description, extract_regex) for ID_PATTERNS
+    COMPILED_ID_PATTERNS = [
+        (re.compile(scan_regex), pattern_regex, description, extract_regex)
+        for scan_regex, (pattern_regex, description, extract_regex)
+        in zip(CASE_SENSITIVE_ID_PATTERNS, ID_PATTERNS)
+    ]
+    
+    # All ID_PATTERNS folded into one regex so each ID is scanned once. Every
+    # pattern becomes an optional lookahead followed by an empty marker group;
+    # match(...).groups()[i] is '' when ID_PATTERNS[i] matches and None otherwise.
+    UNIFIED_ID_PATTERN = re.compile(
+        ''.join(f"(?:(?={scan_regex.lstrip('^')})())?" for scan_regex in CASE_SENSITIVE_ID_PATTERNS)
+    )
+    
+    # Patterns equivalent to a built-in str predicate, which beats the regex VM.
+    # str.isdecimal accepts exactly the Unicode Nd digits that \d does. Prefix
+    # patterns stay on regex: a Python-level predicate for them measured slower.
+    ID_PATTERN_PREDICATES = {
+        'Numeric only format': str.isdecimal,
+    }
+    
+    # Catch-all patterns that never qualify for the uniform fast path
+    GENERIC_PATTERNS = {'Complex format'}
+    
+    # Number of leading IDs used to probe for a pattern shared by every ID
+    FAST_PATH_SAMPLE_SIZE = 50
+    
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(__name__)
     
@@ -38,11 +140,12 @@ class IDPatternDetector:
                 confidence=0.0
             )
         
-        self.logger.info(f"Analyzing {len(test_ids)} test case IDs")
+        self.logger.info("Analyzing %d test case IDs", len(test_ids))
         
-        # Clean and filter IDs
-        clean_ids = [str(id_val).strip() for id_val in test_ids if id_val]
-        clean_ids = [id_val for id_val in clean_ids if id_val and id_val.lower() != 'nan']
+        # Clean and filter IDs in a single fused pass; filter/map keep the
+        # per-ID str() and strip() in C
+        stripped_ids = map(str.strip, map(str, filter(None, test_ids)))
+        clean_ids = [id_val for id_val in stripped_ids if id_val and id_val.lower() != 'nan']
         
         if not clean_ids:
             return IDPatternAnalysis(
@@ -65,26 +168,41 @@ class IDPatternDetector:
             pattern=best_pattern['regex'] if best_pattern else "",
             format_description=best_pattern['description'] if best_pattern else "Unknown format",
             confidence=best_pattern['confidence'] if best_pattern else 0.0,
-            sample_ids=clean_ids[:5],  # First 5 as samples
+            sample_ids=tuple(clean_ids[:5]),  # First 5 as samples
             prefix=components.get('prefix'),
             separator=components.get('separator'),
-            number_part=components.get('number_part')
+            number_part=components.get('number_part'),
+            compiled_extract_regex=self._get_compiled_extract(best_pattern)
         )
         
-        self.logger.info(f"Detected pattern: {analysis.format_description} "
-                        f"(confidence: {analysis.confidence:.2f})")
+        self.logger.info("Detected pattern: %s (confidence: %.2f)",
+                         analysis.format_description, analysis.confidence)
         
         return analysis
     
+    def _get_compiled_extract(self, pattern: Optional[Dict]) -> Optional[re.Pattern]:
+        """Compiled extraction regex of a selected pattern, built-in or custom"""
+        if not pattern:
+            return None
+        return pattern.get('compiled_extract') or self.COMPILED_EXTRACT_PATTERNS.get(pattern['description'])
+    
     def _find_pattern_matches(self, test_ids: List[str]) -> Dict[str, Dict]:
         """Find which patterns match the test IDs"""
+        uniform_match = self._find_uniform_pattern(test_ids)
+        if uniform_match:
+            return uniform_match
+        
         pattern_matches = {}
         
-        for pattern_regex, description, extract_regex in self.ID_PATTERNS:
-            matches = []
-            for test_id in test_ids:
-                if re.match(pattern_regex, test_id, re.IGNORECASE):
-                    matches.append(test_id)
+        # One regex call per ID yields the set of patterns it matches. The scan is
+        # kept serial on purpose: the re engine holds the GIL while matching, so
+        # splitting it across a thread pool only adds scheduling overhead.
+        unified_match = self.UNIFIED_ID_PATTERN.match
+        signatures = [unified_match(test_id).groups() for test_id in test_ids]
+        
+        for index, (pattern_regex, description, extract_regex) in enumerate(self.ID_PATTERNS):
+            matches = [test_id for test_id, signature in zip(test_ids, signatures)
+                       if signature[index] is not None]
             
             if matches:
                 confidence = len(matches) / len(test_ids)
@@ -97,11 +215,46 @@ class IDPatternDetector:
                     'confidence': confidence
                 }
                 
-                self.logger.debug(f"Pattern '{description}': {len(matches)}/{len(test_ids)} matches "
-                                f"({confidence:.2f} confidence)")
+                self.logger.debug("Pattern '%s': %d/%d matches (%.2f confidence)",
+                                  description, len(matches), len(test_ids), confidence)
         
         return pattern_matches
     
+    def _find_uniform_pattern(self, test_ids: List[str]) -> Optional[Dict[str, Dict]]:
+        """Fast path: find the first specific pattern matched by every ID.
+        
+        Such a pattern always wins selection (full confidence, earliest in
+        ID_PATTERNS order), so the remaining patterns need not be scanned.
+        Candidates are probed on a small sample first and the full scan stops
+        at the first mismatch.
+        """
+        sample_size = self.FAST_PATH_SAMPLE_SIZE
+        sample = test_ids[:sample_size]
+        
+        for compiled, pattern_regex, description, extract_regex in self.COMPILED_ID_PATTERNS:
+            if description in self.GENERIC_PATTERNS:
+                continue
+            
+            is_match = self.ID_PATTERN_PREDICATES.get(description, compiled.match)
+            if not all(is_match(test_id) for test_id in sample):
+                continue
+            if not all(is_match(test_id) for test_id in test_ids[sample_size:]):
+                continue
+            
+            self.logger.debug("Pattern '%s' matches all %d IDs", description, len(test_ids))
+            return {
+                description: {
+                    'pattern': pattern_regex,
+                    'extract_regex': extract_regex,
+                    'description': description,
+                    'matches': list(test_ids),
+                    'match_count': len(test_ids),
+                    'confidence': 1.0
+                }
+            }
+        
+        return None
+    
     def _select_best_pattern(self, pattern_matches: Dict[str, Dict], 
                            test_ids: List[str]) -> Optional[Dict]:
         """Select the best matching pattern based on confidence and coverage"""
@@ -138,7 +291,7 @@ class IDPatternDetector:
             return None
         
         # Analyze common characteristics
-        sample_ids = test_ids[:10]  # Use first 10 for analysis
+        sample_ids = islice(test_ids, 10)  # Use first 10 for analysis
         
         # Look for common prefixes
         prefixes = []
@@ -146,7 +299,7 @@ class IDPatternDetector:
         
         for test_id in sample_ids:
             # Find letters followed by numbers or separators
-            match = re.match(r'^([A-Za-z]+)([^A-Za-z\d]*)(\d*)', test_id)
+            match = _CUSTOM_PREFIX_RE.match(test_id)
             if match:
                 prefix, sep, num = match.groups()
                 if prefix:
@@ -160,23 +313,21 @@ class IDPatternDetector:
         
         if common_prefix:
             # Create pattern based on common structure
-            if common_separator:
-                pattern = f"^{re.escape(common_prefix)}{re.escape(common_separator)}\\d+$"
-                description = f"{common_prefix}{common_separator}#### format"
-                extract_regex = f"({re.escape(common_prefix)}){re.escape(common_separator)}(\\d+)"
-            else:
-                pattern = f"^{re.escape(common_prefix)}\\d*.*$"
-                description = f"{common_prefix}#### format (custom)"
-                extract_regex = f"({re.escape(common_prefix)})(.*)"
+            pattern, description, extract_regex, compiled, compiled_extract, compiled_components = \
+                _build_custom_pattern(common_prefix, common_separator)
             
             # Test pattern against all IDs
-            matches = [tid for tid in test_ids if re.match(pattern, tid, re.IGNORECASE)]
+            is_match = compiled.match
+            matches = [tid for tid in test_ids if is_match(tid)]
             confidence = len(matches) / len(test_ids)
             
             return {
                 'pattern': pattern,
                 'extract_regex': extract_regex,
                 'regex': extract_regex,  # Add compatibility key
+                'compiled': compiled,
+                'compiled_extract': compiled_extract,
+                'compiled_components': compiled_components,
                 'description': description,
                 'matches': matches,
                 'match_count': len(matches),
@@ -186,34 +337,29 @@ class IDPatternDetector:
         return None
     
     def _analyze_pattern_components(self, pattern: Optional[Dict], 
-                                  test_ids: List[str]) -> Dict[str, str]:
+                                  test_ids: List[str]) -> Dict[str, Optional[str]]:
         """Analyze the components of the detected pattern"""
-        components = {}
-        
         if not pattern or not pattern.get('extract_regex'):
-            return components
+            return {}
         
-        extract_regex = pattern['extract_regex']
+        compiled_components = pattern.get('compiled_components') or \
+            self.COMPONENT_PATTERNS.get(pattern['description'])
+        if compiled_components is None:
+            return {}
         
-        # Extract components from sample IDs
-        for test_id in test_ids[:5]:
-            match = re.match(extract_regex, test_id, re.IGNORECASE)
-            if match:
-                groups = match.groups()
-                if len(groups) >= 1:
-                    components['prefix'] = groups[0]
-                if len(groups) >= 2:
-                    # Check if second group is separator or number
-                    second_group = groups[1]
-                    if second_group.isdigit():
-                        components['number_part'] = second_group
-                    else:
-                        components['separator'] = second_group
-                        if len(groups) >= 3:
-                            components['number_part'] = groups[2]
-                break
-        
-        return components
+        # Any ID the pattern matched is a valid sample, so extract only once
+        matches = pattern.get('matches')
+        sample = matches[0] if matches else (test_ids[0] if test_ids else None)
+        match = compiled_components.match(sample) if sample is not None else None
+        if not match:
+            return {}
+        
+        groups = match.groupdict()
+        return {
+            'prefix': groups.get('prefix') or None,
+            'separator': groups.get('sep') or None,
+            'number_part': groups.get('num') or None,
+        }
     
     def _most_common(self, items: List[str]) -> Optional[str]:
         """Find the most common item in a list"""
@@ -233,6 +379,9 @@ class IDPatternDetector:
         if not analysis.pattern:
             return False
         
+        if analysis.compiled_extract_regex is not None:
+            return bool(analysis.compiled_extract_regex.match(test_id))
+        
         try:
             return bool(re.match(analysis.pattern, test_id, re.IGNORECASE))
         except re.error:
@@ -5,6 +5,7 @@ This parser is completely isolated from Excel format changes. When formats chang
 only the adapter needs to be updated, not this parser or any other components.
 """
 
+import os
 import pandas as pd
 import logging
 from typing import Optional
@@ -14,6 +15,23 @@ from models.test_models import QTestDocument
 from parsers.excel_format_adapter import ExcelFormatAdapterFactory, ExcelDataConverter
 from parsers.id_pattern_detector import IDPatternDetector
 
+# .xlsx/.xlsm workbooks are read with openpyxl. Setting QTEST_XLSX_ENGINE=calamine
+# opts into pandas' Rust-backed calamine reader (python-calamine, pandas >= 2.2),
+# which is faster but does not read every cell the same way (e.g. error cells
+# such as #N/A), so it must be verified against the QTEST exports in use first.
+_XLSX_ENGINE = 'openpyxl'
+if os.getenv('QTEST_XLSX_ENGINE', '').strip().lower() == 'calamine':
+    try:
+        import python_calamine  # noqa: F401
+        if tuple(int(p) for p in pd.__version__.split('.')[:2]) >= (2, 2):
+            _XLSX_ENGINE = 'calamine'
+        else:
+            logging.getLogger(__name__).warning(
+                "QTEST_XLSX_ENGINE=calamine requires pandas 2.2 or newer; using openpyxl")
+    except ImportError:
+        logging.getLogger(__name__).warning(
+            "QTEST_XLSX_ENGINE=calamine but python-calamine is not installed; using openpyxl")
+
 
 class QTestParser:
     """Format-agnostic QTEST parser using adapter pattern"""
@@ -30,26 +48,32 @@ class QTestParser:
         self.logger.info(f"Parsing QTEST file: {file_path}")
         
         try:
-            # Read Excel file and get sheet names
-            excel_file = pd.ExcelFile(file_path)
-            sheet_names = excel_file.sheet_names
-            self.logger.info(f"Found sheets: {sheet_names}")
-            
-            # Get appropriate adapter for this format
-            adapter = self.adapter_factory.get_adapter(excel_file)
-            
-            # Find the main test sheet using adapter
-            main_sheet = adapter.find_test_sheet(sheet_names)
-            self.logger.info(f"Using main sheet: {main_sheet}")
-            
-            # Read the main sheet
-            df = pd.read_excel(file_path, sheet_name=main_sheet)
+            # Open the workbook once and reuse the handle for the sheet read.
+            # .xlsx workbooks are loaded as values only (openpyxl in
+            # read-only/data-only mode), so styles and formulas of auxiliary
+            # sheets are never materialized.
+            engine = _XLSX_ENGINE if Path(file_path).suffix.lower() in ('.xlsx', '.xlsm') else None
+            with pd.ExcelFile(file_path, engine=engine) as excel_file:
+                sheet_names = excel_file.sheet_names
+                self.logger.info(f"Found sheets: {sheet_names}")
+                
+                # Get appropriate adapter for this format
+                adapter = self.adapter_factory.get_adapter(excel_file)
+                
+                # Find the main test sheet using adapter
+                main_sheet = adapter.find_test_sheet(sheet_names)
+                self.logger.info(f"Using main sheet: {main_sheet}")
+                
+                # Read the main sheet
+                df = excel_file.parse(main_sheet)
             
             # Extract format-agnostic raw data using adapter
             parsing_result = adapter.extract_test_cases(df, sheet_names)
             
             # Convert to domain models
-            test_cases = self.data_converter.convert_to_test_cases(parsing_result.test_cases)
+            test_cases, total_test_steps = self.data_converter.convert_to_test_cases(
+                parsing_result.test_cases
+            )
             
             # Create document
             document = QTestDocument(
@@ -57,16 +81,18 @@ class QTestParser:
                 sheet_names=sheet_names
             )
             
-            # Detect ID pattern
-            test_ids = [tc.id for tc in test_cases]
-            id_analysis = self.id_detector.analyze_ids(test_ids)
+            # Use the adapter's known ID pattern, detecting it only when unknown
+            id_analysis = adapter.get_known_id_pattern()
+            if id_analysis is None:
+                test_ids = [tc.id for tc in test_cases]
+                id_analysis = self.id_detector.analyze_ids(test_ids)
             
             document.detected_id_pattern = id_analysis.pattern
             document.id_format_description = id_analysis.format_description
             
             # Update document statistics
             document.total_test_cases = len(test_cases)
-            document.total_test_steps = sum(tc.get_step_count() for tc in test_cases)
+            document.total_test_steps = total_test_steps
             
             self.logger.info(f"Successfully parsed using {adapter.get_format_name()}")
             self.logger.info(f"Parsed {document.total_test_cases} test cases with "
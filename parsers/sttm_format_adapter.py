@@ -6,14 +6,17 @@ adapter needs to be updated, not the core models or other components.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple
 from dataclasses import dataclass
 import logging
+import sys
 
 from models.sttm_models import STTMDocument, STTMTab, STTMMapping, ChangeType, TabChangeCategory
 
+_logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(slots=True)
 class RawMappingData:
     """Raw mapping data extracted from any STTM format - format-agnostic"""
     source_field: str
@@ -41,7 +44,7 @@ class RawMappingData:
     other_fields: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RawTabData:
     """Raw tab data extracted from any STTM format - format-agnostic"""
     name: str
@@ -66,7 +69,7 @@ class STTMFormatAdapter(ABC):
     """Abstract adapter for different STTM formats"""
     
     @abstractmethod
-    def extract_raw_data(self, json_data: Dict[str, Any]) -> List[RawTabData]:
+    def extract_raw_data(self, json_data: Dict[str, Any]) -> Iterable[RawTabData]:
         """Extract format-agnostic raw data from STTM JSON"""
         pass
     
@@ -85,44 +88,48 @@ class CurrentSTTMFormatAdapter(STTMFormatAdapter):
     """Adapter for the current STTM difference report format"""
     
     def __init__(self, logger: Optional[logging.Logger] = None):
-        self.logger = logger or logging.getLogger(__name__)
+        self.logger = logger or _logger
     
     def get_format_version(self) -> str:
         return "Excel Comparison Tool v2.0"
     
     def validate_format(self, json_data: Dict[str, Any]) -> bool:
         """Validate the current format structure"""
-        required_keys = ["report_metadata", "detailed_changes"]
-        return all(key in json_data for key in required_keys)
+        return "detailed_changes" in json_data and "report_metadata" in json_data
     
-    def extract_raw_data(self, json_data: Dict[str, Any]) -> List[RawTabData]:
-        """Extract data from current STTM format"""
+    def extract_raw_data(self, json_data: Dict[str, Any]) -> Iterator[RawTabData]:
+        """Extract data from current STTM format, yielding one tab at a time"""
         
-        raw_tabs = []
+        tab_count = 0
         
         # Extract changed tabs from current format
         detailed_changes = json_data.get("detailed_changes", {})
         changed_tabs = detailed_changes.get("changed_tabs", [])
         
         for tab_data in changed_tabs:
-            raw_tab = self._extract_tab_data(tab_data, is_changed=True)
-            raw_tabs.append(raw_tab)
+            yield self._extract_tab_data(tab_data, is_changed=True)
+            tab_count += 1
         
         # Extract unchanged tabs if they exist
         unchanged_tabs = detailed_changes.get("unchanged_tabs", [])
         for tab_data in unchanged_tabs:
-            raw_tab = self._extract_tab_data(tab_data, is_changed=False)
-            raw_tabs.append(raw_tab)
+            yield self._extract_tab_data(tab_data, is_changed=False)
+            tab_count += 1
         
-        self.logger.debug(f"Extracted {len(raw_tabs)} tabs from current format")
-        return raw_tabs
+        self.logger.debug("Extracted %d tabs from current format", tab_count)
     
     def _extract_tab_data(self, tab_data: Dict[str, Any], is_changed: bool) -> RawTabData:
         """Extract tab data from current format"""
         
+        change_type = tab_data.get("change_type", "unchanged") if is_changed else "unchanged"
+        if isinstance(change_type, str):
+            # Share one string object per change type across tabs, so the
+            # converter's comparisons and lookups hit the identity fast path
+            change_type = sys.intern(change_type)
+        
         raw_tab = RawTabData(
             name=tab_data.get("tab_name", "Unknown"),
-            change_type=tab_data.get("change_type", "unchanged") if is_changed else "unchanged",
+            change_type=change_type,
             source_system=tab_data.get("source_system"),
             target_system=tab_data.get("target_system")
         )
@@ -150,85 +157,53 @@ class CurrentSTTMFormatAdapter(STTMFormatAdapter):
         )
         
         # Extract modified mappings
-        raw_tab.modified_mappings = self._extract_modified_mappings(
-            mappings_data.get("modified_mappings", [])
+        raw_tab.modified_mappings = self._extract_mappings(
+            mappings_data.get("modified_mappings", []), "modified"
         )
         
         return raw_tab
     
     def _extract_mappings(self, mappings_data: List[Dict[str, Any]], 
                          change_type: str) -> List[RawMappingData]:
-        """Extract mappings from current format"""
-        
-        raw_mappings = []
-        
-        for mapping_data in mappings_data:
-            mapping_fields = mapping_data.get("mapping_fields", {})
-            other_fields = mapping_data.get("other_fields", {})
-            
-            raw_mapping = RawMappingData(
-                source_field=self._get_field_value(mapping_fields, ["Source Field", "source_field"]),
-                target_field=self._get_field_value(mapping_fields, ["Target Field", "target_field"]),
-                source_canonical_name=self._get_field_value(mapping_fields, ["Source Canonical Name"]),
-                target_canonical_name=self._get_field_value(mapping_fields, ["Target Canonical Name"]),
-                target_entity=self._get_field_value(mapping_fields, ["Target Entity"]),
-                source_description=self._get_field_value(other_fields, ["Source Description"]),
-                source_type=self._get_field_value(other_fields, ["Source Type"]),
-                target_type=self._get_field_value(other_fields, ["Target Type"]),
-                target_length=self._get_field_value(other_fields, ["Target Length"]),
-                change_type=change_type,
-                row_number=mapping_data.get("row_number"),
-                original_row_number=mapping_data.get("original_row_number"),
-                other_fields=other_fields
-            )
-            
-            raw_mappings.append(raw_mapping)
+        """Extract mappings from current format, including field changes for modified ones"""
         
-        return raw_mappings
+        modified = change_type == "modified"
+        return [self._extract_mapping(mapping_data, change_type, modified) 
+                for mapping_data in mappings_data]
     
-    def _extract_modified_mappings(self, mappings_data: List[Dict[str, Any]]) -> List[RawMappingData]:
-        """Extract modified mappings from current format"""
-        
-        raw_mappings = []
+    def _extract_mapping(self, mapping_data: Dict[str, Any], change_type: str, 
+                        modified: bool) -> RawMappingData:
+        """Extract a single mapping from current format"""
+        
+        mapping_fields = mapping_data.get("mapping_fields", {})
+        other_fields = mapping_data.get("other_fields", {})
+        field_changes = mapping_data.get("field_changes", {}) if modified else None
+        
+        raw_mapping = RawMappingData(
+            source_field=str(mapping_fields.get("Source Field") or mapping_fields.get("source_field") or ""),
+            target_field=str(mapping_fields.get("Target Field") or mapping_fields.get("target_field") or ""),
+            source_canonical_name=str(mapping_fields.get("Source Canonical Name") or ""),
+            target_canonical_name=str(mapping_fields.get("Target Canonical Name") or ""),
+            target_entity=str(mapping_fields.get("Target Entity") or ""),
+            source_description=str(other_fields.get("Source Description") or ""),
+            source_type=str(other_fields.get("Source Type") or ""),
+            target_type=str(other_fields.get("Target Type") or ""),
+            target_length=str(other_fields.get("Target Length") or ""),
+            change_type=change_type,
+            row_number=mapping_data.get("row_number"),
+            original_row_number=mapping_data.get("original_row_number"),
+            field_changes=field_changes,
+            other_fields=other_fields
+        )
         
-        for mapping_data in mappings_data:
-            mapping_fields = mapping_data.get("mapping_fields", {})
-            field_changes = mapping_data.get("field_changes", {})
-            other_fields = mapping_data.get("other_fields", {})
-            
-            raw_mapping = RawMappingData(
-                source_field=self._get_field_value(mapping_fields, ["Source Field", "source_field"]),
-                target_field=self._get_field_value(mapping_fields, ["Target Field", "target_field"]),
-                source_canonical_name=self._get_field_value(mapping_fields, ["Source Canonical Name"]),
-                target_canonical_name=self._get_field_value(mapping_fields, ["Target Canonical Name"]),
-                target_entity=self._get_field_value(mapping_fields, ["Target Entity"]),
-                source_description=self._get_field_value(other_fields, ["Source Description"]),
-                source_type=self._get_field_value(other_fields, ["Source Type"]),
-                target_type=self._get_field_value(other_fields, ["Target Type"]),
-                target_length=self._get_field_value(other_fields, ["Target Length"]),
-                change_type="modified",
-                row_number=mapping_data.get("row_number"),
-                original_row_number=mapping_data.get("original_row_number"),
-                field_changes=field_changes,
-                other_fields=other_fields
-            )
-            
-            # Set sample data from changes if available
-            if "source_sample_data" in field_changes:
-                sample_change = field_changes["source_sample_data"]
-                if isinstance(sample_change, dict):
-                    raw_mapping.source_sample_data = sample_change.get("new_value")
-            
-            raw_mappings.append(raw_mapping)
+        # Set sample data from changes if available; parsed JSON objects
+        # are always exact dicts, so a class identity check suffices
+        if modified:
+            sample_change = field_changes.get("source_sample_data")
+            if sample_change.__class__ is dict:
+                raw_mapping.source_sample_data = sample_change.get("new_value")
         
-        return raw_mappings
-    
-    def _get_field_value(self, data: Dict[str, Any], possible_keys: List[str]) -> str:
-        """Get field value trying multiple possible key names"""
-        for key in possible_keys:
-            if key in data and data[key]:
-                return str(data[key])
-        return ""
+        return raw_mapping
 
 
 class LegacySTTMFormatAdapter(STTMFormatAdapter):
@@ -263,65 +238,97 @@ class STTMFormatAdapterFactory:
     """Factory to create the appropriate format adapter"""
     
     def __init__(self, logger: Optional[logging.Logger] = None):
-        self.logger = logger or logging.getLogger(__name__)
+        self.logger = logger or _logger
+        self._default_adapter = CurrentSTTMFormatAdapter(logger)
+        # Kept in registration order; adapters later in the list take priority
         self._adapters = [
-            CurrentSTTMFormatAdapter(logger),
-            LegacySTTMFormatAdapter(),
+            self._default_adapter,
             # Add more adapters here as new formats are encountered
         ]
+        self._refresh_validators()
     
     def get_adapter(self, json_data: Dict[str, Any]) -> STTMFormatAdapter:
         """Get the appropriate adapter for the given JSON data"""
         
-        for adapter in self._adapters:
-            if adapter.validate_format(json_data):
+        for validate_format, adapter in self._validators:
+            if validate_format(json_data):
                 self.logger.info(f"Using adapter for format: {adapter.get_format_version()}")
                 return adapter
         
         # Default to current format adapter
         self.logger.warning("No specific adapter found, using current format adapter")
-        return self._adapters[0]
+        return self._default_adapter
     
     def register_adapter(self, adapter: STTMFormatAdapter):
         """Register a new format adapter"""
-        self._adapters.insert(0, adapter)  # Insert at beginning for priority
+        self._adapters.append(adapter)  # Appended last for priority
+        self._refresh_validators()
+    
+    def enable_legacy_adapter(self):
+        """Add the legacy format adapter as a fallback after the current format"""
+        if not any(isinstance(adapter, LegacySTTMFormatAdapter) for adapter in self._adapters):
+            self._adapters.insert(0, LegacySTTMFormatAdapter())
+            self._refresh_validators()
+    
+    def adapter_types(self) -> Tuple[type, ...]:
+        """Classes of the registered adapters in registration order (e.g. for cache keys)"""
+        return tuple(type(adapter) for adapter in self._adapters)
+    
+    def format_versions(self) -> List[str]:
+        """Format versions of the registered adapters, highest priority first"""
+        return [adapter.get_format_version() for _, adapter in self._validators]
+    
+    def _refresh_validators(self):
+        """Rebuild the priority-ordered bound validators after the adapter list changes"""
+        self._validators = [(adapter.validate_format, adapter) for adapter in reversed(self._adapters)]
 
 
 class STTMDataConverter:
     """Converts format-agnostic raw data to domain models"""
     
+    # Raw tab change type to tab change category
+    CHANGE_CATEGORY_MAP = {
+        "mixed": TabChangeCategory.MIXED,
+        "modifications_only": TabChangeCategory.MODIFICATIONS_ONLY,
+        "additions_only": TabChangeCategory.ADDITIONS_ONLY,
+        "deletions_only": TabChangeCategory.DELETIONS_ONLY,
+        "unchanged": TabChangeCategory.UNCHANGED
+    }
+    
     def __init__(self, logger: Optional[logging.Logger] = None):
-        self.logger = logger or logging.getLogger(__name__)
+        self.logger = logger or _logger
     
-    def convert_to_document(self, raw_tabs: List[RawTabData]) -> STTMDocument:
-        """Convert raw tab data to STTMDocument"""
+    def convert_to_document(self, raw_tabs: Iterable[RawTabData]) -> STTMDocument:
+        """Convert raw tab data to STTMDocument, consuming the tabs as they are produced"""
         
         document = STTMDocument()
+        total_mappings = 0
+        total_changes = 0
         
+        # Tabs are converted serially on purpose: conversion is pure-Python
+        # object construction that holds the GIL, so a thread pool only adds
+        # overhead, and it would force the lazily extracted tabs into memory.
         for raw_tab in raw_tabs:
             tab = self._convert_to_tab(raw_tab)
+            total_mappings += len(tab.all_mappings)
             
             if raw_tab.change_type == "unchanged":
                 document.unchanged_tabs.append(tab)
             else:
                 document.changed_tabs.append(tab)
+                total_changes += tab.get_total_changes()
         
-        self._update_document_stats(document)
+        # Document-level statistics, accumulated while the tabs were built
+        document.total_tabs = len(document.changed_tabs) + len(document.unchanged_tabs)
+        document.total_mappings = total_mappings
+        document.total_changes = total_changes
         return document
     
     def _convert_to_tab(self, raw_tab: RawTabData) -> STTMTab:
         """Convert raw tab data to STTMTab"""
         
         # Map change type
-        change_category_map = {
-            "mixed": TabChangeCategory.MIXED,
-            "modifications_only": TabChangeCategory.MODIFICATIONS_ONLY,
-            "additions_only": TabChangeCategory.ADDITIONS_ONLY,
-            "deletions_only": TabChangeCategory.DELETIONS_ONLY,
-            "unchanged": TabChangeCategory.UNCHANGED
-        }
-        
-        change_category = change_category_map.get(raw_tab.change_type, TabChangeCategory.UNCHANGED)
+        change_category = self.CHANGE_CATEGORY_MAP.get(raw_tab.change_type, TabChangeCategory.UNCHANGED)
         
         tab = STTMTab(
             name=raw_tab.name, 
@@ -349,10 +356,10 @@ class STTMDataConverter:
                                     for rm in raw_tab.modified_mappings]
         
         # Combine all mappings
-        tab.all_mappings = (
-            tab.added_mappings + tab.deleted_mappings + 
-            tab.modified_mappings + tab.unchanged_mappings
-        )
+        tab.all_mappings = [
+            *tab.added_mappings, *tab.deleted_mappings,
+            *tab.modified_mappings, *tab.unchanged_mappings
+        ]
         
         return tab
     
@@ -403,11 +410,3 @@ class STTMDataConverter:
         )
         
         return mapping
-    
-    def _update_document_stats(self, document: STTMDocument):
-        """Update document-level statistics"""
-        all_tabs = document.get_all_tabs()
-        
-        document.total_tabs = len(all_tabs)
-        document.total_mappings = sum(len(tab.all_mappings) for tab in all_tabs)
-        document.total_changes = sum(tab.get_total_changes() for tab in document.changed_tabs)
\ No newline at end of file
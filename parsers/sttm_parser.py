@@ -7,20 +7,42 @@ only the adapter needs to be updated, not this parser or any other components.
 
 import json
 import logging
-from typing import Optional
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 from pathlib import Path
 
 from models.sttm_models import STTMDocument
 from parsers.sttm_format_adapter import STTMFormatAdapterFactory, STTMDataConverter
 
+try:
+    # orjson parses straight from bytes and is several times faster than the
+    # stdlib parser on large STTM diff reports. Its JSONDecodeError subclasses
+    # json.JSONDecodeError, so error handling below is unchanged.
+    import orjson as _json
+except ImportError:
+    _json = json
+
+_logger = logging.getLogger(__name__)
+
+# Parsed documents keyed by (resolved path, mtime_ns, size, adapter types), so
+# the validate/analyze flows of the web API don't re-parse an unchanged file.
+# Documents are shared between callers and must be treated as read-only.
+_DOCUMENT_CACHE_SIZE = 32
+_document_cache: "OrderedDict[tuple, STTMDocument]" = OrderedDict()
+_document_cache_lock = threading.Lock()
+
 
 class STTMParser:
     """Format-agnostic STTM parser using adapter pattern"""
     
     def __init__(self, logger: Optional[logging.Logger] = None):
-        self.logger = logger or logging.getLogger(__name__)
+        self.logger = logger or _logger
         self.adapter_factory = STTMFormatAdapterFactory(logger)
         self.data_converter = STTMDataConverter(logger)
+        # Format versions keyed on the factory's adapter types, so adapters added
+        # through the factory directly (e.g. enable_legacy_adapter) are picked up
+        self._supported_formats_cache: Optional[Tuple[tuple, List[str]]] = None
     
     def parse_file(self, file_path: str) -> STTMDocument:
         """Parse STTM file regardless of format version"""
@@ -28,23 +50,45 @@ class STTMParser:
         self.logger.info(f"Parsing STTM file: {file_path}")
         
         try:
-            # Load JSON data
-            with open(file_path, 'r', encoding='utf-8') as f:
-                json_data = json.load(f)
+            # Reuse the document parsed earlier if the file is unchanged
+            path = Path(file_path)
+            stat = path.stat()
+            cache_key = (
+                str(path.resolve()), stat.st_mtime_ns, stat.st_size,
+                self.adapter_factory.adapter_types()
+            )
+            with _document_cache_lock:
+                document = _document_cache.get(cache_key)
+                if document is not None:
+                    _document_cache.move_to_end(cache_key)
+            if document is not None:
+                self.logger.info(f"Using cached STTM document for unchanged file: {file_path}")
+                return document
+            
+            # Load JSON data, letting the parser decode the UTF-8 bytes itself
+            json_data = _json.loads(path.read_bytes())
             
             # Get appropriate adapter for this format
             adapter = self.adapter_factory.get_adapter(json_data)
             
-            # Extract format-agnostic raw data
+            # Extract format-agnostic raw data. Adapters may yield tabs lazily,
+            # so only drop our reference to the parsed JSON: it is freed as
+            # soon as extraction finishes rather than when this call returns
             raw_tabs = adapter.extract_raw_data(json_data)
+            del json_data
             
-            # Convert to domain models
+            # Convert to domain models, consuming raw tabs as they are extracted
             document = self.data_converter.convert_to_document(raw_tabs)
             
             self.logger.info(f"Successfully parsed STTM document using {adapter.get_format_version()}")
             self.logger.info(f"Found {len(document.changed_tabs)} changed tabs, "
                            f"{len(document.unchanged_tabs)} unchanged tabs")
             
+            with _document_cache_lock:
+                _document_cache[cache_key] = document
+                if len(_document_cache) > _DOCUMENT_CACHE_SIZE:
+                    _document_cache.popitem(last=False)
+            
             return document
             
         except FileNotFoundError:
@@ -61,7 +105,10 @@ class STTMParser:
     
     def get_supported_formats(self) -> list:
         """Get list of supported STTM formats"""
-        return [adapter.get_format_version() for adapter in self.adapter_factory._adapters]
+        adapter_types = self.adapter_factory.adapter_types()
+        if self._supported_formats_cache is None or self._supported_formats_cache[0] != adapter_types:
+            self._supported_formats_cache = (adapter_types, self.adapter_factory.format_versions())
+        return list(self._supported_formats_cache[1])
 
 
 def parse_sttm_file(file_path: str, logger: Optional[logging.Logger] = None) -> STTMDocument:
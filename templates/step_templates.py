@@ -5,12 +5,33 @@ Provides standardized templates for generating test step descriptions and expect
 based on different types of STTM changes (added, deleted, modified fields).
 """
 
-from typing import Dict, Any
-from dataclasses import dataclass
+import re
+from functools import lru_cache
+from typing import Dict, Any, Optional, Callable
+from dataclasses import dataclass, field
 from models.sttm_models import STTMMapping
 
 
-@dataclass
+# Patterns like "Defaulted in Gateway to 5" or "default = 7", tried in order
+_DEFAULT_VALUE_PATTERNS = (
+    re.compile(r'defaulted.*?to\s+(\w+)', re.IGNORECASE),
+    re.compile(r'default.*?=\s*(\w+)', re.IGNORECASE),
+    re.compile(r'defaults?\s+to\s+[\'"]?(\w+)[\'"]?', re.IGNORECASE)
+)
+
+
+@lru_cache(maxsize=512)
+def _extract_default_value(description: str) -> str:
+    """Extract default value from description text"""
+    for pattern in _DEFAULT_VALUE_PATTERNS:
+        match = pattern.search(description)
+        if match:
+            return match.group(1)
+    
+    return 'value not specified'
+
+
+@dataclass(slots=True)
 class GeneratedTestStep:
     """Represents a generated test step with all required information"""
     step_number: int
@@ -18,93 +39,98 @@ class GeneratedTestStep:
     expected_result: str
     action: str  # ADD, MODIFY, DELETE
     notes: str = ""
-    original_step_data: Dict[str, Any] = None
-
-    def __post_init__(self):
-        if self.original_step_data is None:
-            self.original_step_data = {}
+    original_step_data: Dict[str, Any] = field(default_factory=dict)
+    
+    # Optional context restored from serialized steps
+    field_name: Optional[str] = None
+    change_type: Optional[str] = None
 
 
 class StepTemplates:
     """Template generator for different types of test step modifications"""
     
-    def __init__(self):
-        self.templates = self._initialize_templates()
-    
-    def _initialize_templates(self) -> Dict[str, Dict[str, str]]:
-        """Initialize all step templates"""
-        return {
-            'deleted_field_verification': {
-                'description': "Verify {field_name} field has been removed from {target_entity}",
-                'expected': "{field_name} field should not exist in target system",
-                'notes': "Verification step for deleted field: {field_name}"
-            },
-            'added_field_validation': {
-                'description': "Validate {source_field} mapping to {target_field} field",
-                'expected': "{source_field} value correctly mapped to {target_entity}.{target_field}",
-                'notes': "New field mapping validation: {source_field} → {target_field}"
-            },
-            'modified_field_update': {
-                'description': "Validate updated {field_name} with new {change_type}",
-                'expected': "Field {field_name} reflects changes: {old_value} → {new_value}",
-                'notes': "Updated validation for modified field: {field_name}"
-            },
-            'sample_data_change': {
-                'description': "Validate {field_name} with updated sample data",
-                'expected': "{field_name} contains new sample value: {new_sample_data}",
-                'notes': "Sample data change for field: {field_name}"
-            },
-            'type_change': {
-                'description': "Validate {field_name} type change from {old_type} to {new_type}",
-                'expected': "{field_name} field accepts {new_type} values and rejects {old_type} format",
-                'notes': "Type validation for field: {field_name} ({old_type} → {new_type})"
-            },
-            'default_value_change': {
-                'description': "Validate {field_name} default value change",
-                'expected': "{field_name} defaults to '{new_default}' when not specified",
-                'notes': "Default value change for field: {field_name}"
-            }
+    # Formatters for each step kind, shared by all instances. Each is an
+    # f-string lambda, so formatting skips str.format's per-call parsing
+    # (string.Template.substitute, which is regex-driven, is slower still)
+    TEMPLATES: Dict[str, Dict[str, Callable[..., str]]] = {
+        'deleted_field_verification': {
+            'description': lambda field_name, target_entity: f"Verify {field_name} field has been removed from {target_entity}",
+            'expected': lambda field_name: f"{field_name} field should not exist in target system",
+            'notes': lambda field_name: f"Verification step for deleted field: {field_name}"
+        },
+        'added_field_validation': {
+            'description': lambda source_field, target_field: f"Validate {source_field} mapping to {target_field} field",
+            'expected': lambda source_field, target_entity, target_field: f"{source_field} value correctly mapped to {target_entity}.{target_field}",
+            'notes': lambda source_field, target_field: f"New field mapping validation: {source_field} → {target_field}"
+        },
+        'modified_field_update': {
+            'description': lambda field_name, change_type: f"Validate updated {field_name} with new {change_type}",
+            'expected': lambda field_name, old_value, new_value: f"Field {field_name} reflects changes: {old_value} → {new_value}",
+            'notes': lambda field_name: f"Updated validation for modified field: {field_name}"
+        },
+        'sample_data_change': {
+            'description': lambda field_name: f"Validate {field_name} with updated sample data",
+            'expected': lambda field_name, new_sample_data: f"{field_name} contains new sample value: {new_sample_data}",
+            'notes': lambda field_name: f"Sample data change for field: {field_name}"
+        },
+        'type_change': {
+            'description': lambda field_name, old_type, new_type: f"Validate {field_name} type change from {old_type} to {new_type}",
+            'expected': lambda field_name, new_type, old_type: f"{field_name} field accepts {new_type} values and rejects {old_type} format",
+            'notes': lambda field_name, old_type, new_type: f"Type validation for field: {field_name} ({old_type} → {new_type})"
+        },
+        'default_value_change': {
+            'description': lambda field_name: f"Validate {field_name} default value change",
+            'expected': lambda field_name, new_default: f"{field_name} defaults to '{new_default}' when not specified",
+            'notes': lambda field_name: f"Default value change for field: {field_name}"
         }
+    }
+    
+    def __init__(self):
+        # Change keys checked in priority order by generate_modified_field_step
+        self._modification_handlers = (
+            ('source_sample_data', self._generate_sample_data_change_step),
+            ('source_type', self._generate_type_change_step)
+        )
     
     def generate_deleted_field_step(self, field_name: str, target_entity: str, 
                                    step_number: int) -> GeneratedTestStep:
         """Generate verification step for deleted field"""
-        template = self.templates['deleted_field_verification']
+        template = self.TEMPLATES['deleted_field_verification']
         
         return GeneratedTestStep(
-            step_number=step_number,
-            description=template['description'].format(
+            step_number,
+            template['description'](
                 field_name=field_name,
                 target_entity=target_entity
             ),
-            expected_result=template['expected'].format(
+            template['expected'](
                 field_name=field_name
             ),
-            action="ADD",
-            notes=template['notes'].format(field_name=field_name)
+            "ADD",
+            template['notes'](field_name=field_name)
         )
     
     def generate_added_field_step(self, mapping: STTMMapping, 
                                  step_number: int) -> GeneratedTestStep:
         """Generate validation step for added field"""
-        template = self.templates['added_field_validation']
+        template = self.TEMPLATES['added_field_validation']
         
-        # Get target entity, fallback to target field if not available
-        target_entity = getattr(mapping, 'target_entity', mapping.target_field) or 'target system'
+        # Get target entity, fallback to a generic name if not available
+        target_entity = mapping.target_entity or 'target system'
         
         return GeneratedTestStep(
-            step_number=step_number,
-            description=template['description'].format(
+            step_number,
+            template['description'](
                 source_field=mapping.source_field,
                 target_field=mapping.target_field
             ),
-            expected_result=template['expected'].format(
+            template['expected'](
                 source_field=mapping.source_field,
                 target_entity=target_entity,
                 target_field=mapping.target_field
             ),
-            action="ADD",
-            notes=template['notes'].format(
+            "ADD",
+            template['notes'](
                 source_field=mapping.source_field,
                 target_field=mapping.target_field
             )
@@ -114,130 +140,136 @@ class StepTemplates:
                                    step_number: int, existing_step_data: Dict[str, Any] = None) -> GeneratedTestStep:
         """Generate modification step for changed field"""
         
-        # Determine the type of modification
-        if 'source_sample_data' in change_details:
-            return self._generate_sample_data_change_step(
-                field_name, change_details, step_number, existing_step_data
-            )
-        elif 'source_type' in change_details:
-            return self._generate_type_change_step(
-                field_name, change_details, step_number, existing_step_data
-            )
-        elif 'source_description' in change_details and 'default' in str(change_details.get('source_description', '')).lower():
+        if existing_step_data is None:
+            existing_step_data = {}
+        
+        # Determine the type of modification from the first well-known change key
+        for change_key, generate_step in self._modification_handlers:
+            if change_key in change_details:
+                return generate_step(field_name, change_details, step_number, existing_step_data)
+        
+        # Only a description change that mentions a default is a default value change
+        description_change = change_details.get('source_description')
+        if isinstance(description_change, dict) and 'default' in str(description_change).lower():
             return self._generate_default_change_step(
                 field_name, change_details, step_number, existing_step_data
             )
-        else:
-            # General modification
-            return self._generate_general_modification_step(
-                field_name, change_details, step_number, existing_step_data
-            )
+        
+        # General modification
+        return self._generate_general_modification_step(
+            field_name, change_details, step_number, existing_step_data
+        )
     
     def _generate_sample_data_change_step(self, field_name: str, change_details: Dict[str, Any],
                                         step_number: int, existing_step_data: Dict[str, Any]) -> GeneratedTestStep:
         """Generate step for sample data changes"""
-        template = self.templates['sample_data_change']
+        template = self.TEMPLATES['sample_data_change']
         
-        old_sample = change_details['source_sample_data'].get('old_value', '')
-        new_sample = change_details['source_sample_data'].get('new_value', '')
+        sample_change = change_details['source_sample_data']
+        old_sample = sample_change.get('old_value', '')
+        new_sample = sample_change.get('new_value', '')
         
         return GeneratedTestStep(
-            step_number=step_number,
-            description=existing_step_data.get('description', template['description'].format(field_name=field_name)),
-            expected_result=template['expected'].format(
+            step_number,
+            existing_step_data.get('description', template['description'](field_name=field_name)),
+            template['expected'](
                 field_name=field_name,
                 new_sample_data=new_sample
             ),
-            action="MODIFY",
-            notes=f"Sample data change: '{old_sample}' → '{new_sample}'",
-            original_step_data=existing_step_data
+            "MODIFY",
+            f"Sample data change: '{old_sample}' → '{new_sample}'",
+            existing_step_data
         )
     
     def _generate_type_change_step(self, field_name: str, change_details: Dict[str, Any],
                                  step_number: int, existing_step_data: Dict[str, Any]) -> GeneratedTestStep:
         """Generate step for field type changes"""
-        template = self.templates['type_change']
+        template = self.TEMPLATES['type_change']
         
-        old_type = change_details['source_type'].get('old_value', '')
-        new_type = change_details['source_type'].get('new_value', '')
+        type_change = change_details['source_type']
+        old_type = type_change.get('old_value', '')
+        new_type = type_change.get('new_value', '')
         
         return GeneratedTestStep(
-            step_number=step_number,
-            description=template['description'].format(
+            step_number,
+            template['description'](
                 field_name=field_name,
                 old_type=old_type,
                 new_type=new_type
             ),
-            expected_result=template['expected'].format(
+            template['expected'](
                 field_name=field_name,
                 new_type=new_type,
                 old_type=old_type
             ),
-            action="MODIFY",
-            notes=template['notes'].format(
+            "MODIFY",
+            template['notes'](
                 field_name=field_name,
                 old_type=old_type,
                 new_type=new_type
             ),
-            original_step_data=existing_step_data
+            existing_step_data
         )
     
     def _generate_default_change_step(self, field_name: str, change_details: Dict[str, Any],
                                     step_number: int, existing_step_data: Dict[str, Any]) -> GeneratedTestStep:
         """Generate step for default value changes"""
-        template = self.templates['default_value_change']
+        template = self.TEMPLATES['default_value_change']
         
         # Extract default values from description change
-        old_desc = change_details.get('source_description', {}).get('old_value', '')
-        new_desc = change_details.get('source_description', {}).get('new_value', '')
+        description_change = change_details.get('source_description')
+        if isinstance(description_change, dict):
+            old_desc = description_change.get('old_value', '')
+            new_desc = description_change.get('new_value', '')
+        else:
+            old_desc = new_desc = ''
         
         # Try to extract default values
-        old_default = self._extract_default_value(old_desc)
-        new_default = self._extract_default_value(new_desc)
+        old_default = _extract_default_value(old_desc)
+        new_default = _extract_default_value(new_desc)
         
         return GeneratedTestStep(
-            step_number=step_number,
-            description=template['description'].format(field_name=field_name),
-            expected_result=template['expected'].format(
+            step_number,
+            template['description'](field_name=field_name),
+            template['expected'](
                 field_name=field_name,
                 new_default=new_default
             ),
-            action="MODIFY",
-            notes=f"Default value change: {old_default} → {new_default}",
-            original_step_data=existing_step_data
+            "MODIFY",
+            f"Default value change: {old_default} → {new_default}",
+            existing_step_data
         )
     
     def _generate_general_modification_step(self, field_name: str, change_details: Dict[str, Any],
                                           step_number: int, existing_step_data: Dict[str, Any]) -> GeneratedTestStep:
         """Generate general modification step"""
-        template = self.templates['modified_field_update']
+        template = self.TEMPLATES['modified_field_update']
         
         # Build change summary
-        changes = []
-        for field, change_data in change_details.items():
-            if isinstance(change_data, dict) and 'old_value' in change_data:
-                changes.append(f"{field}: {change_data['old_value']} → {change_data['new_value']}")
-        
-        change_summary = '; '.join(changes) if changes else 'field modifications'
+        change_summary = '; '.join(
+            f"{changed_field}: {change_data['old_value']} → {change_data['new_value']}"
+            for changed_field, change_data in change_details.items()
+            if isinstance(change_data, dict) and 'old_value' in change_data
+        ) or 'field modifications'
         
         return GeneratedTestStep(
-            step_number=step_number,
-            description=self._append_to_description(
+            step_number,
+            self._append_to_description(
                 existing_step_data.get('description', ''),
-                template['description'].format(field_name=field_name, change_type='modifications'),
+                template['description'](field_name=field_name, change_type='modifications'),
                 field_name
             ),
-            expected_result=self._append_to_expected_result(
+            self._append_to_expected_result(
                 existing_step_data.get('expected_result', ''),
-                template['expected'].format(
+                template['expected'](
                     field_name=field_name,
                     old_value='previous values',
                     new_value='updated values'
                 )
             ),
-            action="MODIFY",
-            notes=f"Field modifications: {change_summary}",
-            original_step_data=existing_step_data
+            "MODIFY",
+            f"Field modifications: {change_summary}",
+            existing_step_data
         )
     
     def _append_to_description(self, existing_description: str, template_description: str, field_name: str) -> str:
@@ -254,32 +286,14 @@ class StepTemplates:
         else:
             return template_expected
     
-    def _extract_default_value(self, description: str) -> str:
-        """Extract default value from description text"""
-        import re
-        
-        # Look for patterns like "Defaulted in Gateway to 5" or "default = 7"
-        patterns = [
-            r'defaulted.*?to\s+(\w+)',
-            r'default.*?=\s*(\w+)',
-            r'defaults?\s+to\s+[\'"]?(\w+)[\'"]?'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
-            if match:
-                return match.group(1)
-        
-        return 'value not specified'
-    
     def create_deletion_flag_step(self, existing_step: Dict[str, Any], 
                                  deleted_field: str) -> GeneratedTestStep:
         """Create step marked for deletion because it references deleted field"""
         return GeneratedTestStep(
-            step_number=existing_step.get('step_number', 0),
-            description=existing_step.get('description', ''),
-            expected_result=existing_step.get('expected_result', ''),
-            action="DELETE",
-            notes=f"Step references deleted field '{deleted_field}' - should be removed",
-            original_step_data=existing_step
+            existing_step.get('step_number', 0),
+            existing_step.get('description', ''),
+            existing_step.get('expected_result', ''),
+            "DELETE",
+            f"Step references deleted field '{deleted_field}' - should be removed",
+            existing_step
         )
\ No newline at end of file
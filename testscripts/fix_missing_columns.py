@@ -34,7 +34,7 @@ def fix_missing_columns():
         )
         """
         cursor.execute(check_query)
-        existing_columns = [row[0] for row in cursor.fetchall()]
+        existing_columns = {row[0] for row in cursor.fetchall()}
         
         required_columns = [
             'delta_json_url', 'delta_excel_url', 'delta_generated_at',
@@ -46,23 +46,32 @@ def fix_missing_columns():
         if missing_columns:
             print(f"Missing columns: {', '.join(missing_columns)}")
             
-            # Add missing columns
-            for col in missing_columns:
-                try:
-                    if col.endswith('_url'):
-                        sql = f"ALTER TABLE version_comparisons ADD {col} NVARCHAR(500) NULL"
-                    else:  # _generated_at
-                        sql = f"ALTER TABLE version_comparisons ADD {col} DATETIME NULL"
-                    
-                    print(f"Adding column: {col}")
-                    cursor.execute(sql)
-                    conn.commit()
-                    print(f"  [OK] Added {col}")
-                except pyodbc.Error as e:
-                    if 'already exists' in str(e):
-                        print(f"  [SKIP] {col} already exists")
-                    else:
-                        print(f"  [ERROR] Failed to add {col}: {e}")
+            column_defs = [
+                f"{col} NVARCHAR(500) NULL" if col.endswith('_url') else f"{col} DATETIME NULL"
+                for col in missing_columns
+            ]
+            
+            # Add all missing columns in one statement (single round-trip and commit)
+            try:
+                print(f"Adding columns: {', '.join(missing_columns)}")
+                cursor.execute(f"ALTER TABLE version_comparisons ADD {', '.join(column_defs)}")
+                conn.commit()
+                print(f"  [OK] Added {len(missing_columns)} columns")
+            except pyodbc.Error as e:
+                conn.rollback()
+                print(f"  [WARNING] Batch add failed ({e}), adding columns one by one")
+                
+                for col, column_def in zip(missing_columns, column_defs):
+                    try:
+                        print(f"Adding column: {col}")
+                        cursor.execute(f"ALTER TABLE version_comparisons ADD {column_def}")
+                        conn.commit()
+                        print(f"  [OK] Added {col}")
+                    except pyodbc.Error as e:
+                        if 'already exists' in str(e):
+                            print(f"  [SKIP] {col} already exists")
+                        else:
+                            print(f"  [ERROR] Failed to add {col}: {e}")
         else:
             print("All columns already exist")
         
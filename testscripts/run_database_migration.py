@@ -4,6 +4,7 @@ Runs the SQL script to add qtest_file column to version_comparisons table
 """
 
 import os
+import re
 import sys
 import pyodbc
 import logging
@@ -17,6 +18,10 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Whole-line SQL comments and GO batch separators in migration scripts
+_COMMENT_LINE_RE = re.compile(r'^\s*--.*$', re.MULTILINE)
+_GO_SEPARATOR_RE = re.compile(r'^\s*GO\s*$', re.MULTILINE | re.IGNORECASE)
+
 
 def get_database_connection():
     """Get database connection using environment variables"""
@@ -45,10 +50,7 @@ def check_column_exists(connection):
         AND COLUMN_NAME = 'qtest_file'
         """
         
-        cursor.execute(query)
-        result = cursor.fetchone()
-        
-        exists = result.column_exists > 0
+        exists = cursor.execute(query).fetchval() > 0
         logger.info(f"Column 'qtest_file' exists: {exists}")
         
         return exists
@@ -58,6 +60,16 @@ def check_column_exists(connection):
         return False
 
 
+def parse_sql_statements(sql_content):
+    """Split SQL script content into batches separated by GO lines, dropping comment lines"""
+    sql_content = _COMMENT_LINE_RE.sub('', sql_content)
+    return [
+        statement.strip()
+        for statement in _GO_SEPARATOR_RE.split(sql_content)
+        if statement.strip()
+    ]
+
+
 def run_migration_sql(connection):
     """Execute the database migration SQL script"""
     try:
@@ -72,33 +84,13 @@ def run_migration_sql(connection):
         
         logger.info(f"Reading SQL migration from: {sql_file_path}")
         
-        # Split SQL content by individual statements (separated by GO or semicolons)
-        sql_statements = []
-        current_statement = ""
-        
-        for line in sql_content.split('\n'):
-            line = line.strip()
-            
-            # Skip comments and empty lines
-            if line.startswith('--') or not line:
-                continue
-            
-            # Handle GO statements (batch separator)
-            if line.upper() == 'GO':
-                if current_statement.strip():
-                    sql_statements.append(current_statement.strip())
-                    current_statement = ""
-                continue
-            
-            current_statement += line + "\n"
-        
-        # Add the last statement if it exists
-        if current_statement.strip():
-            sql_statements.append(current_statement.strip())
+        sql_statements = parse_sql_statements(sql_content)
         
         logger.info(f"Found {len(sql_statements)} SQL statements to execute")
         
-        # Execute each statement
+        # Execute all statements in one transaction and commit once at the end,
+        # so a migration costs a single log flush instead of one per statement
+        connection.autocommit = False
         cursor = connection.cursor()
         
         for i, statement in enumerate(sql_statements, 1):
@@ -107,7 +99,6 @@ def run_migration_sql(connection):
                 logger.debug(f"SQL: {statement[:100]}...")  # Log first 100 chars
                 
                 cursor.execute(statement)
-                connection.commit()
                 
                 logger.info(f"Statement {i} executed successfully")
                 
@@ -117,6 +108,7 @@ def run_migration_sql(connection):
                 connection.rollback()
                 raise
         
+        connection.commit()
         logger.info("All migration statements executed successfully!")
         
     except Exception as e:
@@ -129,7 +121,7 @@ def verify_migration(connection):
     try:
         cursor = connection.cursor()
         
-        # Check column details
+        # Check column details and index existence in a single round-trip
         query = """
         SELECT 
             COLUMN_NAME,
@@ -138,11 +130,19 @@ def verify_migration(connection):
             IS_NULLABLE
         FROM INFORMATION_SCHEMA.COLUMNS 
         WHERE TABLE_NAME = 'version_comparisons' 
-        AND COLUMN_NAME = 'qtest_file'
+        AND COLUMN_NAME = 'qtest_file';
+        
+        SELECT COUNT(*) as index_exists
+        FROM sys.indexes i
+        INNER JOIN sys.objects o ON i.object_id = o.object_id
+        WHERE o.name = 'version_comparisons' 
+        AND i.name = 'IX_version_comparisons_qtest_file';
         """
         
         cursor.execute(query)
         result = cursor.fetchone()
+        cursor.nextset()
+        index_count = cursor.fetchval()
         
         if result:
             logger.info("Migration verification successful!")
@@ -151,19 +151,7 @@ def verify_migration(connection):
             logger.info(f"Max Length: {result.CHARACTER_MAXIMUM_LENGTH}")
             logger.info(f"Nullable: {result.IS_NULLABLE}")
             
-            # Check if index was created
-            index_query = """
-            SELECT COUNT(*) as index_exists
-            FROM sys.indexes i
-            INNER JOIN sys.objects o ON i.object_id = o.object_id
-            WHERE o.name = 'version_comparisons' 
-            AND i.name = 'IX_version_comparisons_qtest_file'
-            """
-            
-            cursor.execute(index_query)
-            index_result = cursor.fetchone()
-            
-            if index_result.index_exists > 0:
+            if index_count > 0:
                 logger.info("Index 'IX_version_comparisons_qtest_file' created successfully")
             else:
                 logger.warning("Index was not created (this might be expected)")
@@ -4,6 +4,8 @@ Tests the new version tracking API endpoints
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import sys
 from pathlib import Path
@@ -11,6 +13,16 @@ from pathlib import Path
 # API base URL - update port based on .env
 API_BASE_URL = "http://127.0.0.1:8000"  # Using port 8000 from .env
 
+# Shared session so all tests reuse pooled keep-alive connections to the API.
+# Transient gateway errors are retried with backoff; a refused connection
+# (server not started) is not retried so that case still fails fast.
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(max_retries=Retry(
+    total=3, connect=0, backoff_factor=0.1,
+    status_forcelist=[502, 503, 504], allowed_methods=["GET"],
+    raise_on_status=False
+)))
+
 
 def test_api_health():
     """Test if API is running"""
@@ -19,7 +31,7 @@ def test_api_health():
     print("="*60)
     
     try:
-        response = requests.get(f"{API_BASE_URL}/api/health", timeout=5)
+        response = SESSION.get(f"{API_BASE_URL}/api/health", timeout=5)
         
         if response.status_code == 200:
             data = response.json()
@@ -41,13 +53,16 @@ def test_api_health():
 
 
 def test_tracked_files_endpoint():
-    """Test GET /api/tracked-files endpoint"""
+    """Test GET /api/tracked-files endpoint
+    
+    Returns (passed, files) so the comparisons test can reuse the file list.
+    """
     print("\n" + "="*60)
     print("TEST 2: GET /api/tracked-files")
     print("="*60)
     
     try:
-        response = requests.get(f"{API_BASE_URL}/api/tracked-files", timeout=10)
+        response = SESSION.get(f"{API_BASE_URL}/api/tracked-files", timeout=10)
         
         if response.status_code == 200:
             data = response.json()
@@ -66,40 +81,44 @@ def test_tracked_files_endpoint():
                 if data.get('message') and 'mock' in data.get('message', '').lower():
                     print("\n  [WARNING] Note: Returning mock data (database may not be configured)")
                     
-                return True
+                return True, files
             else:
                 print(f"[FAIL] API returned success=false")
-                return False
+                return False, None
                 
         else:
             print(f"[FAIL] API returned status code: {response.status_code}")
             print(f"   Response: {response.text[:200]}")
-            return False
+            return False, None
             
     except requests.ConnectionError:
         print(f"[FAIL] Cannot connect to API")
-        return False
+        return False, None
     except Exception as e:
         print(f"[FAIL] Error: {e}")
-        return False
+        return False, None
 
 
-def test_comparisons_endpoint():
-    """Test GET /api/tracked-files/{file_id}/comparisons endpoint"""
+def test_comparisons_endpoint(files=None):
+    """Test GET /api/tracked-files/{file_id}/comparisons endpoint
+    
+    files is the list returned by the tracked files test; it is fetched here if not given.
+    """
     print("\n" + "="*60)
     print("TEST 3: GET /api/tracked-files/{file_id}/comparisons")
     print("="*60)
     
     try:
         # First get a file ID to test with
-        files_response = requests.get(f"{API_BASE_URL}/api/tracked-files", timeout=10)
-        
-        if files_response.status_code != 200:
-            print("[WARNING] Cannot get tracked files to test comparisons")
-            return False
-        
-        files_data = files_response.json()
-        files = files_data.get('files', [])
+        if files is None:
+            files_response = SESSION.get(f"{API_BASE_URL}/api/tracked-files", timeout=10)
+            
+            if files_response.status_code != 200:
+                print("[WARNING] Cannot get tracked files to test comparisons")
+                return False
+            
+            files_data = files_response.json()
+            files = files_data.get('files', [])
         
         if not files:
             print("[WARNING] No tracked files available to test")
@@ -111,7 +130,7 @@ def test_comparisons_endpoint():
             print(f"  Testing with file: {files[0].get('friendly_name')} (ID: {test_file_id})")
         
         # Test comparisons endpoint
-        response = requests.get(
+        response = SESSION.get(
             f"{API_BASE_URL}/api/tracked-files/{test_file_id}/comparisons",
             timeout=10
         )
@@ -223,19 +242,23 @@ def main():
     
     results = []
     
-    # Check if API is running first
-    api_running = test_api_health()
-    results.append(("API Health Check", api_running))
-    
-    if api_running:
-        # Run endpoint tests
-        results.append(("Tracked Files Endpoint", test_tracked_files_endpoint()))
-        results.append(("Comparisons Endpoint", test_comparisons_endpoint()))
-        results.append(("Azure Blob Service", test_azure_blob_service()))
-        results.append(("Impact Analysis Endpoint", test_impact_analysis_endpoint()))
-    else:
-        print("\n[WARNING] Skipping endpoint tests - API is not running")
-        print("   Start the API server with: python -m api.main")
+    try:
+        # Check if API is running first
+        api_running = test_api_health()
+        results.append(("API Health Check", api_running))
+        
+        if api_running:
+            # Run endpoint tests
+            tracked_files_ok, tracked_files = test_tracked_files_endpoint()
+            results.append(("Tracked Files Endpoint", tracked_files_ok))
+            results.append(("Comparisons Endpoint", test_comparisons_endpoint(tracked_files)))
+            results.append(("Azure Blob Service", test_azure_blob_service()))
+            results.append(("Impact Analysis Endpoint", test_impact_analysis_endpoint()))
+        else:
+            print("\n[WARNING] Skipping endpoint tests - API is not running")
+            print("   Start the API server with: python -m api.main")
+    finally:
+        SESSION.close()
     
     # Summary
     print("\n" + "="*60)
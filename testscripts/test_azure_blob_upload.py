@@ -5,10 +5,10 @@ Tests the Azure Blob Storage connection and upload functionality
 
 import os
 import sys
+import hashlib
 import logging
 from pathlib import Path
 from datetime import datetime
-import openpyxl
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -56,17 +56,16 @@ def test_environment_variables():
 
 def create_test_file():
     """Create a test QTest Excel file"""
+    import openpyxl
+    
     test_file_path = Path(__file__).parent / "test_azure_upload.xlsx"
     
-    # Create a workbook with test data
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Test Cases"
+    # Create a write-only workbook and stream the rows into it
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Test Cases")
     
     # Add headers
-    headers = ['Test Case ID', 'Test Case Name', 'Description', 'Priority', 'Status']
-    for i, header in enumerate(headers, 1):
-        ws.cell(row=1, column=i, value=header)
+    ws.append(['Test Case ID', 'Test Case Name', 'Description', 'Priority', 'Status'])
     
     # Add test data
     test_cases = [
@@ -77,16 +76,12 @@ def create_test_file():
         ['TC005', 'Logout Functionality', 'Test user logout process', 'Low', 'Active']
     ]
     
-    for i, test_case in enumerate(test_cases, start=2):
-        for j, value in enumerate(test_case, start=1):
-            ws.cell(row=i, column=j, value=value)
+    for test_case in test_cases:
+        ws.append(test_case)
     
     # Add a second worksheet
     ws2 = wb.create_sheet("Test Steps")
-    ws2['A1'] = 'Test Case ID'
-    ws2['B1'] = 'Step Number'  
-    ws2['C1'] = 'Step Description'
-    ws2['D1'] = 'Expected Result'
+    ws2.append(['Test Case ID', 'Step Number', 'Step Description', 'Expected Result'])
     
     wb.save(test_file_path)
     logger.info(f"[PASS] Created test file: {test_file_path}")
@@ -100,62 +95,60 @@ def test_blob_service_connection(connection_string):
         from azure.storage.blob import BlobServiceClient
         from azure.core.exceptions import AzureError
         
-        logger.info("🔗 Testing Azure Blob Service connection...")
+        logger.info("Testing Azure Blob Service connection...")
         
         # Create blob service client
         blob_service_client = BlobServiceClient.from_connection_string(connection_string)
         
         # Test connection by listing containers (this will fail if connection is invalid)
         containers = list(blob_service_client.list_containers())
-        logger.info(f"✅ Connection successful! Found {len(containers)} containers")
+        logger.info(f"[PASS] Connection successful! Found {len(containers)} containers")
         
         for container in containers[:5]:  # Show first 5 containers
-            logger.info(f"   📁 Container: {container.name}")
+            logger.info(f"   Container: {container.name}")
         
         return True, blob_service_client
         
     except Exception as e:
-        logger.error(f"❌ Failed to connect to Azure Blob Storage: {e}")
+        logger.error(f"[FAIL] Failed to connect to Azure Blob Storage: {e}")
         logger.error(f"   Error type: {type(e).__name__}")
         return False, None
 
 def test_container_operations(blob_service_client, container_name="qtest-files"):
     """Test container creation and operations"""
     try:
-        logger.info(f"📦 Testing container operations for '{container_name}'...")
+        logger.info(f"Testing container operations for '{container_name}'...")
+        
+        from azure.core.exceptions import ResourceExistsError
         
         # Get container client
         container_client = blob_service_client.get_container_client(container_name)
         
-        # Check if container exists
-        exists = container_client.exists()
-        logger.info(f"   Container exists: {exists}")
-        
-        if not exists:
-            logger.info(f"   Creating container '{container_name}'...")
+        # Create the container, treating "already exists" as success (one round-trip)
+        try:
             container_client.create_container()
-            logger.info(f"✅ Container '{container_name}' created successfully")
-        else:
-            logger.info(f"✅ Container '{container_name}' already exists")
+            logger.info(f"[PASS] Container '{container_name}' created successfully")
+        except ResourceExistsError:
+            logger.info(f"[PASS] Container '{container_name}' already exists")
         
         # List blobs in container
         blobs = list(container_client.list_blobs())
         logger.info(f"   Found {len(blobs)} blobs in container")
         
         for blob in blobs[:3]:  # Show first 3 blobs
-            logger.info(f"   📄 Blob: {blob.name} ({blob.size} bytes)")
+            logger.info(f"   Blob: {blob.name} ({blob.size} bytes)")
         
         return True, container_client
         
     except Exception as e:
-        logger.error(f"❌ Container operations failed: {e}")
+        logger.error(f"[FAIL] Container operations failed: {e}")
         logger.error(f"   Error type: {type(e).__name__}")
         return False, None
 
 def test_blob_upload(container_client, test_file_path, comparison_id=123):
     """Test blob upload functionality"""
     try:
-        logger.info(f"📤 Testing blob upload...")
+        logger.info(f"Testing blob upload...")
         
         # Generate blob name
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -163,28 +156,28 @@ def test_blob_upload(container_client, test_file_path, comparison_id=123):
         
         logger.info(f"   Blob name: {blob_name}")
         
-        # Read file content
-        with open(test_file_path, 'rb') as f:
-            file_content = f.read()
-        
-        logger.info(f"   File size: {len(file_content)} bytes")
+        file_size = test_file_path.stat().st_size
+        logger.info(f"   File size: {file_size} bytes")
         
         # Get blob client
         blob_client = container_client.get_blob_client(blob_name)
         
-        # Upload blob
+        # Upload blob, streaming from the file so the SDK can send blocks in parallel
         logger.info("   Uploading to Azure Blob Storage...")
-        blob_client.upload_blob(
-            file_content,
-            overwrite=True,
-            content_settings={
-                'content_type': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-            }
-        )
+        with open(test_file_path, 'rb') as f:
+            blob_client.upload_blob(
+                f,
+                length=file_size,
+                overwrite=True,
+                max_concurrency=4,
+                content_settings={
+                    'content_type': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+                }
+            )
         
         # Get blob URL
         blob_url = blob_client.url
-        logger.info(f"✅ Upload successful!")
+        logger.info(f"[PASS] Upload successful!")
         logger.info(f"   Blob URL: {blob_url}")
         
         # Verify upload by getting blob properties
@@ -193,55 +186,63 @@ def test_blob_upload(container_client, test_file_path, comparison_id=123):
         logger.info(f"   Content type: {properties.content_settings.content_type}")
         logger.info(f"   Last modified: {properties.last_modified}")
         
-        return True, blob_url, blob_name
+        return True, blob_url, blob_client
         
     except Exception as e:
-        logger.error(f"❌ Blob upload failed: {e}")
+        logger.error(f"[FAIL] Blob upload failed: {e}")
         logger.error(f"   Error type: {type(e).__name__}")
         logger.error(f"   Error details: {str(e)}")
         return False, None, None
 
-def test_blob_download(container_client, blob_name):
-    """Test blob download functionality"""
+def test_blob_download(blob_client):
+    """Test blob download functionality, returning the SHA-256 digest of the content"""
     try:
-        logger.info(f"📥 Testing blob download...")
-        
-        blob_client = container_client.get_blob_client(blob_name)
+        logger.info(f"Testing blob download...")
         
-        # Download blob
-        blob_data = blob_client.download_blob()
-        content = blob_data.readall()
+        # Download blob, hashing the chunks as they arrive
+        digest = hashlib.sha256()
+        downloaded_size = 0
+        for chunk in blob_client.download_blob().chunks():
+            digest.update(chunk)
+            downloaded_size += len(chunk)
         
-        logger.info(f"✅ Download successful!")
-        logger.info(f"   Downloaded size: {len(content)} bytes")
+        logger.info(f"[PASS] Download successful!")
+        logger.info(f"   Downloaded size: {downloaded_size} bytes")
         
-        return True, content
+        return True, digest.digest()
         
     except Exception as e:
-        logger.error(f"❌ Blob download failed: {e}")
+        logger.error(f"[FAIL] Blob download failed: {e}")
         return False, None
 
-def cleanup_test_blob(container_client, blob_name):
+def file_sha256(file_path, chunk_size=64 * 1024):
+    """SHA-256 digest of a local file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+def cleanup_test_blob(blob_client):
     """Clean up test blob"""
     try:
-        logger.info(f"🧹 Cleaning up test blob...")
+        logger.info(f"Cleaning up test blob...")
         
-        blob_client = container_client.get_blob_client(blob_name)
         blob_client.delete_blob()
         
-        logger.info(f"✅ Test blob deleted: {blob_name}")
+        logger.info(f"[PASS] Test blob deleted: {blob_client.blob_name}")
         
     except Exception as e:
-        logger.warning(f"⚠️ Failed to cleanup blob: {e}")
+        logger.warning(f"[WARNING] Failed to cleanup blob: {e}")
 
 def cleanup_test_file(test_file_path):
     """Clean up test file"""
     try:
         if test_file_path.exists():
             test_file_path.unlink()
-            logger.info(f"🧹 Cleaned up test file: {test_file_path}")
+            logger.info(f"Cleaned up test file: {test_file_path}")
     except Exception as e:
-        logger.warning(f"⚠️ Could not clean up test file: {e}")
+        logger.warning(f"[WARNING] Could not clean up test file: {e}")
 
 def main():
     """Run complete Azure Blob Storage test suite"""
@@ -257,14 +258,13 @@ def main():
     # Test 2: Environment variables
     env_ok, azure_conn, sql_conn = test_environment_variables()
     if not env_ok:
-        logger.error("💡 To fix: Add AZURE_STORAGE_CONNECTION_STRING to your .env file")
+        logger.error("[INFO] To fix: Add AZURE_STORAGE_CONNECTION_STRING to your .env file")
         return False
     
     # Test 3: Create test file
     test_file_path = create_test_file()
     
-    container_client = None
-    blob_name = None
+    blob_client = None
     
     try:
         # Test 4: Blob service connection
@@ -280,47 +280,44 @@ def main():
             return False
         
         # Test 6: Blob upload
-        upload_ok, blob_url, blob_name = test_blob_upload(container_client, test_file_path)
+        upload_ok, blob_url, blob_client = test_blob_upload(container_client, test_file_path)
         if not upload_ok:
             success = False
             return False
         
         # Test 7: Blob download (verification)
-        download_ok, content = test_blob_download(container_client, blob_name)
+        download_ok, downloaded_digest = test_blob_download(blob_client)
         if not download_ok:
             success = False
         
         # Verify file integrity
         if download_ok:
-            with open(test_file_path, 'rb') as f:
-                original_content = f.read()
-            
-            if len(content) == len(original_content) and content == original_content:
-                logger.info("✅ File integrity verified - upload/download successful!")
+            if downloaded_digest == file_sha256(test_file_path):
+                logger.info("[PASS] File integrity verified - upload/download successful!")
             else:
-                logger.error("❌ File integrity check failed")
+                logger.error("[FAIL] File integrity check failed")
                 success = False
         
     finally:
         # Cleanup
-        if container_client and blob_name:
-            cleanup_test_blob(container_client, blob_name)
+        if blob_client:
+            cleanup_test_blob(blob_client)
         cleanup_test_file(test_file_path)
     
     print("\n" + "=" * 60)
-    print("🏁 TEST RESULTS")
+    print("TEST RESULTS")
     print("=" * 60)
     
     if success:
-        print("🎉 ALL TESTS PASSED!")
-        print("✅ Azure Blob Storage is working correctly")
-        print("✅ Connection string is valid")
-        print("✅ Container operations work")
-        print("✅ File upload/download works")
-        print("✅ File integrity is maintained")
+        print("ALL TESTS PASSED!")
+        print("[PASS] Azure Blob Storage is working correctly")
+        print("[PASS] Connection string is valid")
+        print("[PASS] Container operations work")
+        print("[PASS] File upload/download works")
+        print("[PASS] File integrity is maintained")
         print("\nYour Azure configuration is ready for QTest uploads!")
     else:
-        print("❌ SOME TESTS FAILED")
+        print("[FAIL] SOME TESTS FAILED")
         print("Please check the errors above and verify:")
         print("- Azure Storage connection string is correct")
         print("- Azure Storage account has proper permissions")
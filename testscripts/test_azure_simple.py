@@ -8,7 +8,6 @@ import sys
 import logging
 from pathlib import Path
 from datetime import datetime
-import openpyxl
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -26,6 +25,7 @@ def main():
     try:
         # Test imports
         from azure.storage.blob import BlobServiceClient
+        from azure.core.exceptions import ResourceExistsError
         logger.info("[PASS] Azure libraries imported")
     except ImportError as e:
         logger.error(f"[FAIL] Azure import failed: {e}")
@@ -52,14 +52,16 @@ def main():
         container_name = "qtest-files"
         container_client = blob_service_client.get_container_client(container_name)
         
-        if not container_client.exists():
-            logger.info(f"Creating container: {container_name}")
+        # Create the container, treating "already exists" as success (one round-trip)
+        try:
             container_client.create_container()
-            logger.info("[PASS] Container created")
-        else:
+            logger.info(f"[PASS] Container created: {container_name}")
+        except ResourceExistsError:
             logger.info("[PASS] Container exists")
         
         # Create test file
+        import openpyxl
+        
         test_file = Path(__file__).parent / "azure_test.xlsx"
         wb = openpyxl.Workbook()
         ws = wb.active
@@ -68,9 +70,6 @@ def main():
         wb.save(test_file)
         
         # Test upload
-        with open(test_file, 'rb') as f:
-            content = f.read()
-        
         blob_name = f"test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
         blob_client = container_client.get_blob_client(blob_name)
         
@@ -81,7 +80,9 @@ def main():
         )
         
         logger.info(f"Uploading blob: {blob_name}")
-        blob_client.upload_blob(content, overwrite=True, content_settings=content_settings)
+        with open(test_file, 'rb') as f:
+            blob_client.upload_blob(f, length=test_file.stat().st_size, overwrite=True,
+                                    max_concurrency=4, content_settings=content_settings)
         
         blob_url = blob_client.url
         logger.info(f"[PASS] Upload successful!")
@@ -5,8 +5,30 @@ Configuration management for the STTM impact analysis tool.
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 import json
+import logging
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+
+def _write_json_if_changed(file_path: str, data: Dict[str, Any], ensure_ascii: bool = True) -> bool:
+    """Write data as indented JSON, leaving the file untouched if it already has that content
+    
+    Skipping identical rewrites keeps the file's mtime stable for mtime-keyed caches.
+    Returns True if the file was written.
+    """
+    content = json.dumps(data, indent=2, ensure_ascii=ensure_ascii)
+    path = Path(file_path)
+    try:
+        if path.read_text(encoding='utf-8') == content:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return True
+
 
 @dataclass
 class MatchingConfig:
@@ -196,8 +218,7 @@ class Phase2Config:
             "output_directory": self.output_directory
         }
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(config_dict, f, indent=2)
+        _write_json_if_changed(file_path, config_dict)
     
     @classmethod
     def load_from_file(cls, file_path: str) -> 'Phase2Config':
@@ -344,8 +365,7 @@ def load_config(config_file: Optional[str] = None) -> STTMConfig:
         try:
             return STTMConfig.load_from_file(config_file)
         except Exception as e:
-            print(f"Warning: Could not load config file {config_file}: {e}")
-            print("Using default configuration")
+            logger.warning("Could not load config file %s: %s. Using default configuration", config_file, e)
     
     return get_default_config()
 
@@ -526,8 +546,7 @@ def save_phase2_config(output_file: str = "phase2_config.json", preset: str = "b
             "_output_directory_explanation": "Where to save impact analysis reports"
         }
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(config_dict, f, indent=2, ensure_ascii=False)
+        _write_json_if_changed(output_file, config_dict, ensure_ascii=False)
     else:
         # Standard configuration without documentation
         config.save_to_file(output_file)
@@ -544,7 +563,7 @@ def load_phase2_config(config_file: Optional[str] = None) -> Phase2Config:
         try:
             return Phase2Config.load_from_file(config_file)
         except Exception as e:
-            print(f"Warning: Could not load Phase 2 config file {config_file}: {e}")
-            print("Using default Phase 2 configuration")
+            logger.warning("Could not load Phase 2 config file %s: %s. Using default Phase 2 configuration",
+                           config_file, e)
     
     return get_default_phase2_config()
\ No newline at end of file